@@ -4,7 +4,6 @@ config.py - Centralized configuration for CoffeeBreak_NPL project
 This module defines all key paths and settings for scraping, parsing, and analysis pipelines.
 Import this module to avoid hardcoding and to enable scalable, testable code.
 """
-import os
 from pathlib import Path
 
 # --- Directory Settings ---
@@ -13,18 +12,18 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.absolute()
 
 #: Data directory (absolute path)
-DATA_DIR = os.path.join(PROJECT_ROOT, "data")
+DATA_DIR = PROJECT_ROOT / "data"
 
 # --- RSS Feed Scraper/Parser Settings ---
 
 #: Remote RSS feed URL for Coffee Break podcast
 FEED_URL = "https://feeds.feedburner.com/PodcastCoffeeBreak"
 
-#: Local path for downloaded RSS XML (relative to project root)
-FEED_PATH = os.path.join("data", "rss", "audiofeedcoffeebreak.xml")
+#: Local path for downloaded RSS XML (absolute path)
+FEED_PATH = DATA_DIR / "rss" / "audiofeedcoffeebreak.xml"
 
-#: Local path for parsed JSON index (relative to project root)
-OUTPUT_JSON = os.path.join("data", "parsed_json", "audiofeed_index.json")
+#: Local path for parsed JSON index (absolute path)
+OUTPUT_JSON = DATA_DIR / "parsed_json" / "audiofeed_index.json"
 
 #: HTTP request timeout in seconds
 TIMEOUT = 30
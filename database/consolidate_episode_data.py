@@ -29,20 +29,29 @@ Optional Flags:
 import argparse
 import json
 import logging
+import operator
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Set
+from typing import Dict, Iterable, List, Optional, Tuple, Any, Set
 
 # Rich for pretty output
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.table import Table
-from rich.progress import track
+from rich.progress import Progress, track
 from rich.panel import Panel
 from rich.logging import RichHandler
 
+# orjson is optional; it parses and serialises large JSON files much faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Ensure project root is in path
 sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
 
@@ -57,12 +66,13 @@ console = Console()
 logging.basicConfig(
     level=logging.INFO,
     format="%(message)s",
-    handlers=[RichHandler(rich_tracebacks=True, console=console)]
+    handlers=[RichHandler(rich_tracebacks=True, console=console, markup=False,
+                          show_path=False, log_time_format="%H:%M:%S")]
 )
 logger = logging.getLogger("consolidate_episodes")
 
 # File paths
-DATA_DIR = Path(config.DATA_DIR)
+DATA_DIR = config.DATA_DIR
 AUDIOFEED_JSON = DATA_DIR / "parsed_json" / "audiofeed_index.json"
 CBINFO_JSON = DATA_DIR / "parsed_json" / "cbinfo_index.json"
 WEB_PARSE_JSON = DATA_DIR / "parsed_json" / "web_parse.json"
@@ -71,41 +81,68 @@ OUTPUT_PATH = Path(__file__).parent / "master_scrapping_data.json"
 # Episode part types
 PART_TYPES = ["A", "B", "Supl", "Only"]
 
+# Sort rank of each part type (unknown part types sort last)
+PART_ORDER = {part_type: rank for rank, part_type in enumerate(PART_TYPES)}
+
+# Episode number and optional part suffix, e.g. 'Ep105' or 'Ep105_A'
+EPISODE_ID_RE = re.compile(r"Ep(\d+)(?:_([A-Za-z]+))?")
+
+# Audiofeed fields copied into each part, fetched together with one itemgetter call
+# (entries missing any of them fall back to per-key .get with '' defaults)
+AUDIOFEED_FIELDS = ("date", "duration", "description", "audio_url", "link", "title", "image_url")
+get_audiofeed_fields = operator.itemgetter(*AUDIOFEED_FIELDS)
+
 
 def load_json_file(path: str) -> dict:
     """Load a JSON file and return as Python dictionary."""
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Hand the parser raw bytes, skipping the text-mode decode layer
+        data = Path(path).read_bytes()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        return json.loads(data)
     except Exception as e:
         logger.error(f"Failed to load {path}: {str(e)}")
         sys.exit(1)
 
 
-def group_audiofeed_by_episode(audiofeed_data: list) -> dict:
+def iter_with_progress(items: Iterable, description: str, progress: Optional[Progress] = None) -> Iterable:
+    """Iterate over items, reporting on a shared Progress if given, else on a standalone track() bar."""
+    if progress is None:
+        yield from track(items, description=description)
+        return
+    
+    task = progress.add_task(description, total=len(items))
+    for item in items:
+        yield item
+        progress.advance(task)
+
+
+def group_audiofeed_by_episode(audiofeed_data: list, progress: Optional[Progress] = None) -> dict:
     """Group audiofeed entries into single episodes, based on their parts."""
     episodes = {}
     
-    for entry in track(audiofeed_data, description="Grouping audio feed entries"):
+    for entry in iter_with_progress(audiofeed_data, "Grouping audio feed entries", progress):
         # Skip entries without episode_id
         if 'episode_id' not in entry:
-            logger.warning(f"Entry missing episode_id: {entry}")
+            logger.warning("Entry missing episode_id: %s", entry)
             continue
             
         ep_id = str(entry['episode_id'])  # Ensure ep_id is a string
         
         # Extract episode number and part
-        match = re.search(r'Ep(\d+)(?:_([A-Za-z]+))?', ep_id)
+        match = EPISODE_ID_RE.search(ep_id)
         if not match:
-            logger.warning(f"Could not parse episode ID: {ep_id}")
+            logger.warning("Could not parse episode ID: %s", ep_id)
             continue
             
         ep_number = match.group(1).zfill(3)  # Pad to 3 digits
         ep_part = match.group(2) if match.group(2) else "Only"
         
         # Initialize episode group if not exists
-        if ep_number not in episodes:
-            episodes[ep_number] = {
+        episode = episodes.get(ep_number)
+        if episode is None:
+            episode = episodes[ep_number] = {
                 "Episode number": ep_number,
                 "Episode class": "Single" if ep_part == "Only" else "Dual",
                 "Title": "",
@@ -114,31 +151,37 @@ def group_audiofeed_by_episode(audiofeed_data: list) -> dict:
                 "ref_links": [],
                 "Parts": []
             }
-        elif episodes[ep_number]["Episode class"] == "Single" and ep_part != "Only":
+        elif episode["Episode class"] == "Single" and ep_part != "Only":
             # Update to Dual if we have multiple parts
-            episodes[ep_number]["Episode class"] = "Dual"
+            episode["Episode class"] = "Dual"
         
         # Add this part to the episode - use correct key names 'date' and 'link'
+        try:
+            date, duration, description, audio_url, link, title, image_url = get_audiofeed_fields(entry)
+        except KeyError:
+            date, duration, description, audio_url, link, title, image_url = (
+                entry.get(key, '') for key in AUDIOFEED_FIELDS
+            )
         entry_clean = {
             "Episode_ID": ep_id,
             "Part_class": ep_part,
-            "Date": entry.get('date', ''),
-            "Duration": entry.get('duration', ''),
-            "raw_description": entry.get('description', ''),
-            "Audio_URL": entry.get('audio_url', ''),
-            "Ivoox_link": entry.get('link', ''),
+            "Date": date,
+            "Duration": duration,
+            "raw_description": description,
+            "Audio_URL": audio_url,
+            "Ivoox_link": link,
             "Topics": [],
             "Contertulios": []
         }
         
         # Update title/image if not previously set
-        if not episodes[ep_number]["Title"] and 'title' in entry and entry['title']:
-            episodes[ep_number]["Title"] = entry['title']
+        if not episode["Title"] and title:
+            episode["Title"] = title
             
-        if not episodes[ep_number]["Image_url"] and 'image_url' in entry and entry['image_url']:
-            episodes[ep_number]["Image_url"] = entry['image_url']
+        if not episode["Image_url"] and image_url:
+            episode["Image_url"] = image_url
             
-        episodes[ep_number]["Parts"].append(entry_clean)
+        episode["Parts"].append(entry_clean)
     
     return episodes
 
@@ -175,62 +218,78 @@ def resolve_conflicts(title_options: list, image_options: list) -> tuple:
     return selected_title, selected_image
 
 
-def enrich_episode_with_webdata(episode_id: str, web_data: list) -> tuple:
-    """Retrieve web_link and ref_links from web_parse.json based on episode number."""
-    web_link = ""
-    ref_links = []
-    
-    # Strip leading zeros to match possible variations in episode numbering
-    clean_ep_id = f"Ep{episode_id.lstrip('0')}"
-    
+def index_web_data(web_data: list) -> dict:
+    """Index web_parse.json entries by lowercased ep_id (first occurrence wins)."""
+    web_index = {}
     for entry in web_data:
-        if entry.get('ep_id', '').lower() == clean_ep_id.lower():
-            web_link = entry.get('ep_web_link', '')
-            ref_links = entry.get('ep_links', [])
-            break
-    
-    return web_link, ref_links
+        web_index.setdefault(entry.get('ep_id', '').lower(), entry)
+    return web_index
 
 
-def enrich_episode_with_cbinfo(episode_part_id: str, cbinfo_data: list) -> tuple:
-    """Retrieve topics and contertulios for each part from cbinfo_index.json."""
-    topics = []
-    contertulios = []
-    
+def index_cbinfo_data(cbinfo_data: list) -> dict:
+    """Index cbinfo_index.json entries by episode_id (first occurrence wins)."""
+    cbinfo_index = {}
     for entry in cbinfo_data:
-        if entry.get('episode_id', '') == episode_part_id:
-            topics = entry.get('topics', [])
-            contertulios = entry.get('contertulios', [])
-            break
+        cbinfo_index.setdefault(entry.get('episode_id', ''), entry)
+    return cbinfo_index
+
+
+def enrich_episode_with_webdata(episode_id: str, web_index: dict) -> tuple:
+    """Retrieve web_link and ref_links from the web_parse.json index based on episode number."""
+    # Strip leading zeros to match possible variations in episode numbering
+    clean_ep_id = f"Ep{episode_id.lstrip('0')}"
     
-    return topics, contertulios
+    entry = web_index.get(clean_ep_id.lower())
+    if entry is None:
+        return "", []
+    return entry.get('ep_web_link', ''), entry.get('ep_links', [])
 
 
-def build_episode_structure(grouped_parts: dict, web_data: list, cbinfo_data: list) -> list:
-    """Assemble final episode dict following target schema."""
+def enrich_episode_with_cbinfo(episode_part_id: str, cbinfo_index: dict) -> tuple:
+    """Retrieve topics and contertulios for each part from the cbinfo_index.json index."""
+    entry = cbinfo_index.get(episode_part_id)
+    if entry is None:
+        return [], []
+    return entry.get('topics', []), entry.get('contertulios', [])
+
+
+def build_episode_structure(grouped_parts: dict, web_index: dict, cbinfo_index: dict,
+                            progress: Optional[Progress] = None) -> list:
+    """
+    Assemble final episode dict following target schema.
+    
+    The enrichment sources are passed pre-indexed (see index_web_data and
+    index_cbinfo_data) so each lookup is O(1).
+    """
     master_data = []
     
-    for ep_num, episode in track(grouped_parts.items(), description="Building episode structure"):
+    for ep_num, episode in iter_with_progress(grouped_parts.items(), "Building episode structure", progress):
         # Gather all titles and images from parts to resolve conflicts
         title_options = []
         image_options = []
+        seen_titles = set()
+        seen_images = set()
+        
+        # Find web data (depends only on the episode number, not on the part)
+        web_link, ref_links = enrich_episode_with_webdata(ep_num, web_index)
+        episode["web_link"] = web_link
+        episode["ref_links"] = ref_links
         
         for part in episode["Parts"]:
-            # Find web data
-            web_link, ref_links = enrich_episode_with_webdata(ep_num, web_data)
-            episode["web_link"] = web_link
-            episode["ref_links"] = ref_links
-            
             # Find cbinfo data for each part
-            topics, contertulios = enrich_episode_with_cbinfo(part["Episode_ID"], cbinfo_data)
+            topics, contertulios = enrich_episode_with_cbinfo(part["Episode_ID"], cbinfo_index)
             part["Topics"] = topics
             part["Contertulios"] = contertulios
             
             # Add title and image for conflict resolution
-            if "Title" in part and part["Title"] and part["Title"] not in title_options:
-                title_options.append(part["Title"])
-            if "Image_url" in part and part["Image_url"] and part["Image_url"] not in image_options:
-                image_options.append(part["Image_url"])
+            title = part.get("Title")
+            if title and title not in seen_titles:
+                seen_titles.add(title)
+                title_options.append(title)
+            image_url = part.get("Image_url")
+            if image_url and image_url not in seen_images:
+                seen_images.add(image_url)
+                image_options.append(image_url)
         
         # Resolve any conflicts
         if len(title_options) > 1 or len(image_options) > 1:
@@ -239,25 +298,8 @@ def build_episode_structure(grouped_parts: dict, web_data: list, cbinfo_data: li
             episode["Image_url"] = selected_image
         
         # Sort parts in consistent order: A, B, Supl, Only
-        episode["Parts"].sort(key=lambda x: PART_TYPES.index(x["Part_class"]) if x["Part_class"] in PART_TYPES else 999)
+        episode["Parts"].sort(key=lambda x: PART_ORDER.get(x["Part_class"], 999))
         
-        # Ensure we're keeping all parts data intact
-        cleaned_parts = []
-        for part in episode["Parts"]:
-            cleaned_part = {
-                "Episode_ID": part.get("Episode_ID", ""),
-                "Part_class": part.get("Part_class", ""),
-                "Date": part.get("Date", ""),
-                "Duration": part.get("Duration", ""),
-                "raw_description": part.get("raw_description", ""),  # Preserve raw_description from audiofeed
-                "Audio_URL": part.get("Audio_URL", ""),
-                "Ivoox_link": part.get("Ivoox_link", ""),
-                "Topics": part.get("Topics", []),
-                "Contertulios": part.get("Contertulios", [])
-            }
-            cleaned_parts.append(cleaned_part)
-            
-        episode["Parts"] = cleaned_parts
         master_data.append(episode)
     
     # Sort episodes by number
@@ -266,10 +308,29 @@ def build_episode_structure(grouped_parts: dict, web_data: list, cbinfo_data: li
 
 
 def save_master_data(master_data: list, output_path: str):
-    """Save the unified master data to JSON file."""
+    """
+    Save the unified master data to JSON file.
+    
+    Records are serialised one at a time and streamed to disk, so peak
+    memory stays at one encoded record instead of the whole document.
+    """
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(master_data, f, ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb', buffering=1 << 20) as f:
+                if not master_data:
+                    f.write(b"[]")
+                else:
+                    # Re-indent each record by one level to match a whole-list indent=2 dump
+                    f.write(b"[\n  ")
+                    for i, record in enumerate(master_data):
+                        if i:
+                            f.write(b",\n  ")
+                        f.write(orjson.dumps(record, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+                    f.write(b"\n]")
+        else:
+            # json.dump already streams its chunks to the file handle
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(master_data, f, ensure_ascii=False, indent=2)
         logger.info(f"Successfully saved master data to {output_path}")
     except Exception as e:
         logger.error(f"Failed to save master data: {str(e)}")
@@ -278,8 +339,8 @@ def save_master_data(master_data: list, output_path: str):
 def report_completion_rate(master_data: list):
     """Analyze and print missing fields per episode."""
     total_episodes = len(master_data)
-    episodes_with_web_link = sum(1 for ep in master_data if ep["web_link"])
-    episodes_with_ref_links = sum(1 for ep in master_data if ep["ref_links"])
+    episodes_with_web_link = 0
+    episodes_with_ref_links = 0
     
     parts_with_topics = 0
     parts_with_contertulios = 0
@@ -287,9 +348,15 @@ def report_completion_rate(master_data: list):
     parts_with_ivoox = 0
     total_parts = 0
     
+    # Count every metric in a single traversal of the episodes and their parts
     for episode in master_data:
-        for part in episode["Parts"]:
-            total_parts += 1
+        if episode["web_link"]:
+            episodes_with_web_link += 1
+        if episode["ref_links"]:
+            episodes_with_ref_links += 1
+        parts = episode["Parts"]
+        total_parts += len(parts)
+        for part in parts:
             if part.get("Topics", []):
                 parts_with_topics += 1
             if part.get("Contertulios", []):
@@ -367,20 +434,27 @@ def main(report_only: bool = False):
     console.print("[bold]Loading source data...[/bold]")
     
     try:
-        audiofeed_data = load_json_file(AUDIOFEED_JSON)
-        cbinfo_data = load_json_file(CBINFO_JSON)
-        web_data = load_json_file(WEB_PARSE_JSON)
+        # The three sources are independent, so read them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            audiofeed_future = executor.submit(load_json_file, AUDIOFEED_JSON)
+            cbinfo_future = executor.submit(load_json_file, CBINFO_JSON)
+            web_future = executor.submit(load_json_file, WEB_PARSE_JSON)
+            audiofeed_data = audiofeed_future.result()
+            cbinfo_index = index_cbinfo_data(cbinfo_future.result())
+            web_index = index_web_data(web_future.result())
     except Exception as e:
         logger.error(f"Failed to load required source files: {str(e)}")
         return
     
-    # Group by episode
-    console.print("[bold]Grouping episodes...[/bold]")
-    grouped_parts = group_audiofeed_by_episode(audiofeed_data)
-    
-    # Consolidate parts
-    console.print("[bold]Enriching with web and cbinfo data...[/bold]")
-    master_data = build_episode_structure(grouped_parts, web_data, cbinfo_data)
+    # Share one progress display across both stages instead of one renderer per loop
+    with Progress(console=console, refresh_per_second=4, transient=True) as progress:
+        # Group by episode
+        console.print("[bold]Grouping episodes...[/bold]")
+        grouped_parts = group_audiofeed_by_episode(audiofeed_data, progress)
+        
+        # Consolidate parts
+        console.print("[bold]Enriching with web and cbinfo data...[/bold]")
+        master_data = build_episode_structure(grouped_parts, web_index, cbinfo_index, progress)
     
     # Save output
     console.print("[bold]Saving output...[/bold]")
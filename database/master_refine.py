@@ -7,12 +7,14 @@ such as consolidated publication dates and total episode durations.
 It provides a rich CLI interface with options for specific refinement tasks.
 
 Usage:
-    python master_refine.py [--add-dates] [--add-total-duration] [--clean-promo-links] [--verbose] [--dry-run]
+    python master_refine.py [--add-dates] [--add-total-duration] [--clean-promo-links] [--streaming] [--compact] [--verbose] [--dry-run]
 
 Options:
     --add-dates         Extract earliest date from parts and add to episode level (DD/MM/YYYY)
     --add-total-duration Calculate total duration in seconds from all parts
     --clean-promo-links Remove promotional links from episodes (defined in promo-links-list.json)
+    --streaming         Process one episode at a time with ijson (optional dependency)
+    --compact           Write the refined JSON without indentation
     --dry-run           Show what would change but don't write to file
     --verbose           Enable detailed logging output
     --help              Show this help message and exit
@@ -24,11 +26,15 @@ import os
 import sys
 import json
 import argparse
+import functools
 import logging
+import operator
 import re
-from datetime import datetime
+import shutil
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import BinaryIO, Dict, FrozenSet, Iterable, Iterator, List, Any, Optional, Tuple
 
 try:
     from rich.console import Console
@@ -39,6 +45,20 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+# orjson is optional; it parses and serialises the master JSON much faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson is optional; it is only needed for --streaming
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Add project root to path for importing config
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -53,6 +73,37 @@ MASTER_JSON_PATH = Path("database/master_scrapping_data.json")
 BACKUP_JSON_PATH = MASTER_JSON_PATH.with_suffix(".bak")
 PROMO_LINKS_PATH = Path("links_retrieval/promo-links-list.json")
 
+# Smallest input worth starting a rich progress display for
+PROGRESS_MIN_ITEMS = 200
+
+# --- Regex and lookup tables ---
+# Dominant RSS pubDate shape, e.g. "Thu, 03 Apr 2025 20:41:51 +0200" (offset optional)
+RFC2822_DATE_RE = re.compile(
+    r"(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun), (\d{2}) (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) "
+    r"(\d{4}) (\d{2}):(\d{2}):(\d{2})(?: ([+-])(\d{2})(\d{2}))?"
+)
+# Part durations, "HH:MM:SS" or "MM:SS"
+DURATION_RE = re.compile(r"\s*(?:(\d+):)?(\d+):(\d+)\s*")
+
+# Title prefixes such as "Ep123: ", "Ep 45_A: " (cleaned by --clean-titles)
+TITLE_PREFIX_RE = re.compile(r"^Ep ?\d{2,3}(_[A-Za-z]+)?: ?")
+
+# Common date formats used in the dataset, tried in order by parse_date
+DATE_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %z",  # Thu, 03 Apr 2025 20:41:51 +0200
+    "%a, %d %b %Y %H:%M:%S",     # Thu, 03 Apr 2025 20:41:51
+    "%Y-%m-%d %H:%M:%S",         # 2025-04-03 20:41:51
+    "%Y-%m-%d",                  # 2025-04-03
+)
+
+MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+# part -> part.get("Duration"), as a C-level callable for map()
+get_part_duration = operator.methodcaller("get", "Duration")
+
 # --- Logging setup ---
 def setup_logger(verbose: bool = False) -> logging.Logger:
     """Configure rich logger with appropriate verbosity level."""
@@ -75,6 +126,28 @@ def setup_logger(verbose: bool = False) -> logging.Logger:
     return logging.getLogger("master_refine")
 
 # --- Utility functions ---
+def progress_iter(data: List[Any], description: str) -> Iterable[Any]:
+    """
+    Wrap data in a rich progress bar only when it will actually be seen.
+    
+    Rendering a progress bar costs more than the per-episode work in the
+    refinement loops, so plain iteration is used when rich is missing,
+    stdout is not an interactive terminal, or there are fewer than
+    PROGRESS_MIN_ITEMS items.
+    
+    Args:
+        data: Items to iterate over
+        description: Progress bar label
+        
+    Returns:
+        An iterable over data
+    """
+    if (RICH_AVAILABLE and hasattr(data, "__len__") and len(data) >= PROGRESS_MIN_ITEMS
+            and sys.stdout.isatty()):
+        return track(data, description=description)
+    return data
+
+@functools.lru_cache(maxsize=4096)
 def parse_duration(duration_str: str) -> int:
     """
     Parse a duration string in format "HH:MM:SS" or "MM:SS" to seconds.
@@ -83,26 +156,26 @@ def parse_duration(duration_str: str) -> int:
         duration_str: String in format "HH:MM:SS" or "MM:SS"
         
     Returns:
-        Total duration in seconds (int)
+        Total duration in seconds (int), 0 for empty or invalid strings
     """
     if not duration_str:
         return 0
-        
-    parts = duration_str.strip().split(":")
-    
-    if len(parts) == 3:  # HH:MM:SS
-        hours, minutes, seconds = parts
-        return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
-    elif len(parts) == 2:  # MM:SS
-        minutes, seconds = parts
-        return int(minutes) * 60 + int(seconds)
-    else:
+    
+    match = DURATION_RE.fullmatch(duration_str)
+    if not match:
         return 0  # Invalid format
+    
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
 
+@functools.lru_cache(maxsize=None)
 def parse_date(date_str: str) -> Optional[datetime]:
     """
     Parse a date string in common formats to a datetime object.
     
+    Results are memoized: parts of the same episode often share a date
+    string, and datetime objects are immutable so sharing them is safe.
+    
     Args:
         date_str: String in various date formats
         
@@ -111,16 +184,22 @@ def parse_date(date_str: str) -> Optional[datetime]:
     """
     if not date_str:
         return None
+    
+    # Fast path: build the datetime straight from the regex groups, skipping strptime
+    match = RFC2822_DATE_RE.fullmatch(date_str)
+    if match:
+        day, month, year, hour, minute, second, sign, tz_hours, tz_minutes = match.groups()
+        try:
+            tzinfo = None
+            if sign:
+                offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes))
+                tzinfo = timezone(-offset if sign == "-" else offset)
+            return datetime(int(year), MONTHS[month], int(day),
+                            int(hour), int(minute), int(second), tzinfo=tzinfo)
+        except ValueError:
+            pass  # Out-of-range field; let the strptime chain decide
         
-    # Common date formats used in the dataset
-    formats = [
-        "%a, %d %b %Y %H:%M:%S %z",  # Thu, 03 Apr 2025 20:41:51 +0200
-        "%a, %d %b %Y %H:%M:%S",     # Thu, 03 Apr 2025 20:41:51
-        "%Y-%m-%d %H:%M:%S",         # 2025-04-03 20:41:51
-        "%Y-%m-%d",                  # 2025-04-03
-    ]
-    
-    for fmt in formats:
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -139,7 +218,8 @@ def get_date_string(dt: datetime) -> str:
         String in format DD/MM/YYYY
     """
     if dt:
-        return dt.strftime("%d/%m/%Y")
+        # Plain formatting skips strftime's format parsing
+        return f"{dt.day:02d}/{dt.month:02d}/{dt.year}"
     return ""
 
 def backup_json(json_path: Path, backup_path: Path) -> bool:
@@ -154,26 +234,108 @@ def backup_json(json_path: Path, backup_path: Path) -> bool:
         True if backup was successful
     """
     try:
-        with json_path.open('rb') as src, backup_path.open('wb') as dst:
-            dst.write(src.read())
+        # Kernel-side copy (sendfile/copy_file_range) without buffering the file in Python
+        shutil.copyfile(json_path, backup_path)
         return True
     except Exception as e:
         logging.error(f"Failed to create backup: {e}")
         return False
 
-def load_promo_links() -> List[str]:
+def load_master_json(json_path: Path = MASTER_JSON_PATH) -> List[Dict[str, Any]]:
+    """
+    Load the master JSON in a single read.
+
+    Args:
+        json_path: Path to the master JSON
+
+    Returns:
+        List of episode dictionaries
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(json_path.read_bytes())
+    with json_path.open("rb", buffering=1 << 20) as fp:
+        return json.load(fp)
+
+def save_master_json(data: List[Dict[str, Any]], json_path: Path = MASTER_JSON_PATH,
+                     compact: bool = False) -> None:
+    """
+    Write the master JSON.
+
+    orjson serialises to one bytes object written in a single call; the
+    stdlib fallback streams into a large write buffer instead of building
+    the whole pretty-printed string first.
+
+    Args:
+        data: List of episode dictionaries
+        json_path: Path to the master JSON
+        compact: Write without indentation or whitespace (smaller and faster)
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        json_path.write_bytes(orjson.dumps(data, option=option))
+    else:
+        with json_path.open("w", encoding=ENCODING, buffering=1 << 20) as fp:
+            if compact:
+                json.dump(data, fp, ensure_ascii=False, separators=(",", ":"))
+            else:
+                json.dump(data, fp, ensure_ascii=False, indent=2)
+
+def stream_episodes(src: BinaryIO, dst: Optional[BinaryIO], stats: Dict[str, Any],
+                    compact: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Yield master JSON episodes one at a time, writing each back once refined.
+    
+    Episodes are parsed incrementally with ijson, so only one is held in
+    memory. Each episode is written to dst when the consumer asks for the
+    next one, i.e. after it has been updated in place. The output matches
+    save_master_json's layout for the same compact setting.
+    
+    Args:
+        src: Master JSON opened in binary mode
+        dst: Binary file for the refined JSON, or None to discard (dry run)
+        stats: Statistics dictionary; "episodes" is incremented per episode
+        compact: Write without indentation or whitespace
+        
+    Yields:
+        Episode dictionaries
+    """
+    if dst is not None:
+        dst.write(b"[")
+    separator = b"" if compact else b"\n  "
+    for episode in ijson.items(src, "item", use_float=True):
+        stats["episodes"] += 1
+        yield episode
+        if dst is not None:
+            if compact:
+                if ORJSON_AVAILABLE:
+                    encoded = orjson.dumps(episode, option=orjson.OPT_NON_STR_KEYS)
+                else:
+                    encoded = json.dumps(episode, ensure_ascii=False, separators=(",", ":")).encode(ENCODING)
+                dst.write(separator + encoded)
+                separator = b","
+            else:
+                if ORJSON_AVAILABLE:
+                    encoded = orjson.dumps(episode, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                else:
+                    encoded = json.dumps(episode, ensure_ascii=False, indent=2).encode(ENCODING)
+                dst.write(separator + encoded.replace(b"\n", b"\n  "))
+                separator = b",\n  "
+    if dst is not None:
+        dst.write(b"\n]" if stats["episodes"] and not compact else b"]")
+
+def load_promo_links() -> FrozenSet[str]:
     """
     Load promotional links from promo-links-list.json.
     
     Returns:
-        List of promotional links (strings)
+        Frozen set of promotional links (strings), for O(1) membership tests
     """
     try:
         with PROMO_LINKS_PATH.open('r', encoding=ENCODING) as f:
-            return json.load(f)
+            return frozenset(json.load(f))
     except Exception as e:
         logging.error(f"Failed to load promo links: {e}")
-        return []
+        return frozenset()
 
 # --- Processing functions ---
 def add_episode_dates(data: List[Dict[str, Any]], logger: logging.Logger) -> Tuple[List[Dict[str, Any]], int]:
@@ -189,22 +351,22 @@ def add_episode_dates(data: List[Dict[str, Any]], logger: logging.Logger) -> Tup
         Tuple of (updated data, count of updates)
     """
     updated_count = 0
+    _parse_date = parse_date  # local binding for the hot loop
     
-    for episode in track(data, description="Processing episode dates..."):
-        parts = episode.get("Parts", [])
-        dates = []
+    for episode in progress_iter(data, "Processing episode dates..."):
+        parts = episode.get("Parts", ())
+        earliest_date = None
         
-        # Extract valid dates from all parts
+        # Track the earliest valid date across all parts
         for part in parts:
             date_str = part.get("Date")
             if date_str:
-                date_obj = parse_date(date_str)
-                if date_obj:
-                    dates.append(date_obj)
+                date_obj = _parse_date(date_str)
+                if date_obj and (earliest_date is None or date_obj < earliest_date):
+                    earliest_date = date_obj
         
         # If we found any dates, use the earliest one
-        if dates:
-            earliest_date = min(dates)
+        if earliest_date is not None:
             date_str = get_date_string(earliest_date)
             
             # Only update if needed
@@ -228,17 +390,14 @@ def add_total_durations(data: List[Dict[str, Any]], logger: logging.Logger) -> T
         Tuple of (updated data, count of updates)
     """
     updated_count = 0
-    
-    for episode in track(data, description="Calculating episode durations..."):
-        parts = episode.get("Parts", [])
-        total_seconds = 0
-        
-        # Sum durations from all parts
-        for part in parts:
-            duration_str = part.get("Duration")
-            if duration_str:
-                duration_seconds = parse_duration(duration_str)
-                total_seconds += duration_seconds
+    # Local bindings for the hot loop
+    _parse_duration = parse_duration
+    _get_duration = get_part_duration
+    
+    for episode in progress_iter(data, "Calculating episode durations..."):
+        # Sum durations from all parts; sum/map iterate in C, and parse_duration
+        # returns 0 for missing or empty durations
+        total_seconds = sum(map(_parse_duration, map(_get_duration, episode.get("Parts", ()))))
         
         # Only update if there are parts with durations and total > 0
         if total_seconds > 0:
@@ -270,12 +429,14 @@ def clean_promo_links(data: List[Dict[str, Any]], logger: logging.Logger) -> Tup
     
     # Statistics dictionary to track removals by episode
     stats = {}
+    total_removed = 0
     
-    for episode in track(data, description="Cleaning promotional links..."):
+    for episode in progress_iter(data, "Cleaning promotional links..."):
         episode_num = episode.get("Episode number", "Unknown")
         ref_links = episode.get("ref_links", [])
         
-        if not ref_links:
+        # isdisjoint runs in C; most episodes carry no promo links at all
+        if not ref_links or promo_links.isdisjoint(ref_links):
             continue
             
         # Find promotional links in this episode
@@ -287,16 +448,101 @@ def clean_promo_links(data: List[Dict[str, Any]], logger: logging.Logger) -> Tup
         if removed_count > 0:
             episode["ref_links"] = cleaned_links
             stats[episode_num] = removed_count
+            total_removed += removed_count
             logger.debug(f"Removed {removed_count} promo links from episode {episode_num}")
     
-    total_removed = sum(stats.values())
     logger.info(f"Removed {total_removed} promotional links across {len(stats)} episodes")
     
     return data, stats
 
+def refine_all(data: Iterable[Dict[str, Any]], logger: logging.Logger, add_dates: bool = False,
+               add_duration: bool = False, clean_links: bool = False
+               ) -> Tuple[Iterable[Dict[str, Any]], int, int, Dict[str, int]]:
+    """
+    Run several refinement tasks in a single pass over the episodes.
+    
+    Produces the same results as calling add_episode_dates, add_total_durations
+    and clean_promo_links one after another, but walks data (and each
+    episode's parts) only once.
+    
+    Args:
+        data: Episode data dictionaries; a list, or a stream_episodes iterator
+        logger: Logger instance
+        add_dates: Whether to add publication dates
+        add_duration: Whether to add total durations
+        clean_links: Whether to clean promotional links
+        
+    Returns:
+        Tuple of (updated data, date updates, duration updates, link cleaning statistics)
+    """
+    promo_links = frozenset()
+    if clean_links:
+        promo_links = load_promo_links()
+        if promo_links:
+            logger.info(f"Loaded {len(promo_links)} promotional links to remove")
+        else:
+            logger.error("No promotional links loaded. Skipping link cleaning.")
+            clean_links = False
+    
+    date_updates = 0
+    duration_updates = 0
+    link_stats = {}
+    links_removed = 0
+    
+    # Bind hot-loop helpers to locals to skip global lookups per part
+    _parse_date = parse_date
+    _parse_duration = parse_duration
+    
+    for episode in progress_iter(data, "Refining episodes..."):
+        earliest_date = None
+        total_seconds = 0
+        
+        # Dates and durations share one walk over the parts
+        for part in episode.get("Parts", ()):
+            if add_dates:
+                date_str = part.get("Date")
+                if date_str:
+                    date_obj = _parse_date(date_str)
+                    if date_obj and (earliest_date is None or date_obj < earliest_date):
+                        earliest_date = date_obj
+            if add_duration:
+                duration_str = part.get("Duration")
+                if duration_str:
+                    total_seconds += _parse_duration(duration_str)
+        
+        if earliest_date is not None:
+            date_str = get_date_string(earliest_date)
+            if episode.get("publication_date") != date_str:
+                episode["publication_date"] = date_str
+                date_updates += 1
+                logger.debug(f"Added date {date_str} to episode {episode.get('Episode number', 'Unknown')}")
+        
+        if total_seconds > 0 and episode.get("total_duration_seconds") != total_seconds:
+            episode["total_duration_seconds"] = total_seconds
+            duration_updates += 1
+            logger.debug(f"Added total duration {total_seconds}s to episode {episode.get('Episode number', 'Unknown')}")
+        
+        if clean_links:
+            ref_links = episode.get("ref_links", [])
+            if ref_links and not promo_links.isdisjoint(ref_links):
+                cleaned_links = [link for link in ref_links if link not in promo_links]
+                removed_count = len(ref_links) - len(cleaned_links)
+                if removed_count > 0:
+                    episode_num = episode.get("Episode number", "Unknown")
+                    episode["ref_links"] = cleaned_links
+                    link_stats[episode_num] = removed_count
+                    links_removed += removed_count
+                    logger.debug(f"Removed {removed_count} promo links from episode {episode_num}")
+    
+    if clean_links:
+        logger.info(f"Removed {links_removed} promotional links across {len(link_stats)} episodes")
+    
+    return data, date_updates, duration_updates, link_stats
+
 # --- Main function ---
 def main(add_dates: bool = False, add_duration: bool = False, 
-         clean_links: bool = False, dry_run: bool = False, verbose: bool = False) -> None:
+         clean_links: bool = False, dry_run: bool = False, verbose: bool = False,
+         streaming: bool = False, compact: bool = False) -> None:
     """
     Main processing function with command-line arguments.
     
@@ -306,13 +552,15 @@ def main(add_dates: bool = False, add_duration: bool = False,
         clean_links: Whether to clean promotional links
         dry_run: Whether to perform a dry run without writing changes
         verbose: Whether to enable verbose logging
+        streaming: Whether to process one episode at a time with ijson
+        compact: Whether to write the JSON without indentation
     """
     logger = setup_logger(verbose)
     console = Console()
     
     logger.info("🔍 Coffee Break JSON Master Refiner")
     
-    if not any([add_dates, add_duration, clean_links]):
+    if not (add_dates or add_duration or clean_links):
         logger.warning("No refinement tasks specified. Nothing to do!")
         console.print("\n[yellow]Hint:[/yellow] Use --add-dates, --add-total-duration, or --clean-promo-links to specify tasks.")
         return
@@ -321,13 +569,18 @@ def main(add_dates: bool = False, add_duration: bool = False,
         logger.error(f"Master JSON not found at: {MASTER_JSON_PATH}")
         return
     
-    # Load master data
-    try:
-        data = json.loads(MASTER_JSON_PATH.read_text(encoding=ENCODING))
-        logger.info(f"Loaded {len(data)} episode entries from {MASTER_JSON_PATH}")
-    except Exception as e:
-        logger.error(f"Failed to load JSON: {e}")
-        return
+    if streaming:
+        if not IJSON_AVAILABLE:
+            logger.error("--streaming requires the 'ijson' package. Install it using 'pip install ijson'.")
+            return
+    else:
+        # Load master data
+        try:
+            data = load_master_json()
+            logger.info(f"Loaded {len(data)} episode entries from {MASTER_JSON_PATH}")
+        except Exception as e:
+            logger.error(f"Failed to load JSON: {e}")
+            return
     
     # Create backup unless dry run
     if not dry_run:
@@ -339,25 +592,49 @@ def main(add_dates: bool = False, add_duration: bool = False,
                 return
     
     updates_made = False
-    stats = {"episodes": len(data), "updates": 0}
+    stats = {"episodes": 0 if streaming else len(data), "updates": 0}
     
-    # Process dates if requested
-    if add_dates:
+    if streaming:
+        # Refine episode by episode into a temporary file, swapped in below
+        stream_path = MASTER_JSON_PATH.with_suffix(".json.tmp")
+        try:
+            with MASTER_JSON_PATH.open("rb") as src, \
+                    (nullcontext() if dry_run else stream_path.open("wb", buffering=1 << 20)) as dst:
+                _, date_updates, duration_updates, link_stats = refine_all(
+                    stream_episodes(src, dst, stats, compact=compact), logger,
+                    add_dates=add_dates, add_duration=add_duration, clean_links=clean_links
+                )
+        except Exception as e:
+            logger.error(f"Failed to stream JSON: {e}")
+            stream_path.unlink(missing_ok=True)
+            return
+        logger.info(f"Streamed {stats['episodes']} episode entries from {MASTER_JSON_PATH}")
+    # Run every requested task in one pass when more than one is set
+    elif sum((add_dates, add_duration, clean_links)) > 1:
+        data, date_updates, duration_updates, link_stats = refine_all(
+            data, logger, add_dates=add_dates, add_duration=add_duration, clean_links=clean_links
+        )
+    elif add_dates:
         data, date_updates = add_episode_dates(data, logger)
+    elif add_duration:
+        data, duration_updates = add_total_durations(data, logger)
+    else:
+        data, link_stats = clean_promo_links(data, logger)
+    
+    # Record dates results if requested
+    if add_dates:
         updates_made = updates_made or date_updates > 0
         stats["date_updates"] = date_updates
         logger.info(f"Added dates to {date_updates} episodes")
     
-    # Process durations if requested
+    # Record durations results if requested
     if add_duration:
-        data, duration_updates = add_total_durations(data, logger)
         updates_made = updates_made or duration_updates > 0
         stats["duration_updates"] = duration_updates
         logger.info(f"Added durations to {duration_updates} episodes")
     
-    # Clean promotional links if requested
+    # Record link cleaning results if requested
     if clean_links:
-        data, link_stats = clean_promo_links(data, logger)
         updates_made = updates_made or bool(link_stats)
         stats["link_stats"] = link_stats
         stats["total_links_removed"] = sum(link_stats.values()) if link_stats else 0
@@ -370,15 +647,17 @@ def main(add_dates: bool = False, add_duration: bool = False,
             logger.info("[DRY RUN] Would write updated JSON to file")
         else:
             try:
-                MASTER_JSON_PATH.write_text(
-                    json.dumps(data, ensure_ascii=False, indent=2),
-                    encoding=ENCODING
-                )
+                if streaming:
+                    os.replace(stream_path, MASTER_JSON_PATH)
+                else:
+                    save_master_json(data, compact=compact)
                 logger.info(f"Successfully wrote updated JSON to {MASTER_JSON_PATH}")
             except Exception as e:
                 logger.error(f"Failed to write JSON: {e}")
     else:
         logger.info("No updates were needed.")
+        if streaming and not dry_run:
+            stream_path.unlink(missing_ok=True)
     
     # Print final statistics
     table = Table(title="Master JSON Refinement Results")
@@ -415,13 +694,14 @@ def main(add_dates: bool = False, add_duration: bool = False,
             link_table.add_column("Episode", style="cyan")
             link_table.add_column("Links Removed", justify="right", style="red")
             
-            # Sort episodes by number for better display
-            sorted_episodes = sorted(
-                stats["link_stats"].items(), 
-                key=lambda x: (int(x[0]) if x[0].isdigit() else float('inf'), x[0])
-            )
-            
-            for episode_num, count in sorted_episodes:
+            # Sort episodes by number for better display (keys computed once per episode)
+            link_rows = [
+                (int(k) if k.isdigit() else sys.maxsize, k, v)
+                for k, v in stats["link_stats"].items()
+            ]
+            link_rows.sort(key=operator.itemgetter(0, 1))
+
+            for _, episode_num, count in link_rows:
                 link_table.add_row(episode_num, str(count))
                 
             console.print(link_table)
@@ -442,6 +722,7 @@ Examples:
   python master_refine.py --clean-promo-links
   python master_refine.py --add-dates --add-total-duration --dry-run
   python master_refine.py --add-dates --add-total-duration --verbose
+  python master_refine.py --add-dates --add-total-duration --streaming
         """
     )
     
@@ -465,6 +746,16 @@ Examples:
         action="store_true", 
         help="Enable detailed logging output"
     )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Process episodes one at a time with ijson instead of loading the whole file"
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write the refined JSON without indentation (smaller, faster to write)"
+    )
     parser.add_argument(
         "--clean-promo-links", 
         action="store_true", 
@@ -500,8 +791,7 @@ Examples:
             sys.exit(1)
 
         # Load the JSON data
-        with MASTER_JSON_PATH.open("r", encoding=ENCODING) as file:
-            data = json.load(file)
+        data = load_master_json()
 
         # Display the titles table
         display_titles_table(data)
@@ -510,30 +800,26 @@ Examples:
     # Add logic to handle the `--clean-titles` flag
     if args.clean_titles:
         # Create a backup of the original JSON file
-        with MASTER_JSON_PATH.open("r", encoding=ENCODING) as original_file:
-            with BACKUP_JSON_PATH.open("w", encoding=ENCODING) as backup_file:
-                backup_file.write(original_file.read())
+        if not backup_json(MASTER_JSON_PATH, BACKUP_JSON_PATH):
+            sys.exit(1)
 
         print(f"Backup created at {BACKUP_JSON_PATH}")
 
         # Load the JSON data
-        with MASTER_JSON_PATH.open("r", encoding=ENCODING) as file:
-            data = json.load(file)
-
-        # Update the regex pattern to handle cases with a space between "Ep" and the number
-        pattern = re.compile(r"^Ep ?\d{2,3}(_[A-Za-z]+)?: ?")
+        data = load_master_json()
 
-        # Clean titles and track affected titles
+        # Clean titles and track affected titles (one regex scan per title)
         affected_titles = []
         for episode in data:
             title = episode.get("Title", "")
-            if title and pattern.match(title):
-                affected_titles.append(title)
-                episode["Title"] = pattern.sub("", title)
+            if title:
+                cleaned_title, replaced = TITLE_PREFIX_RE.subn("", title, count=1)
+                if replaced:
+                    affected_titles.append(title)
+                    episode["Title"] = cleaned_title
 
         # Save the cleaned data back to the JSON file
-        with MASTER_JSON_PATH.open("w", encoding=ENCODING) as file:
-            json.dump(data, file, ensure_ascii=False, indent=2)
+        save_master_json(data)
 
         print("Titles cleaned successfully.")
 
@@ -565,8 +851,7 @@ Examples:
             sys.exit(1)
 
         # Load the JSON data
-        with MASTER_JSON_PATH.open("r", encoding=ENCODING) as file:
-            data = json.load(file)
+        data = load_master_json()
 
         # Define the range of episodes to process
         start_episode = 473
@@ -581,16 +866,21 @@ Examples:
 
         # Process the specified range of episodes
         changes_made = False
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         for episode in data:
-            episode_number = int(episode.get("Episode number", 0))
+            episode_str = str(episode.get("Episode number", ""))
+            if not episode_str.isdigit():
+                continue
+            episode_number = int(episode_str)
             if start_episode <= episode_number <= end_episode:
                 original_parts = episode.get("Parts", [])
                 original_parts_count = len(original_parts)
 
                 # Log details of parts before filtering
-                for part in original_parts:
-                    part_class = part.get("Part_class", "N/A")
-                    logger.debug(f"Episode {episode_number}: Part class = {part_class}")
+                if debug_enabled:
+                    for part in original_parts:
+                        part_class = part.get("Part_class", "N/A")
+                        logger.debug(f"Episode {episode_number}: Part class = {part_class}")
 
                 filtered_parts = [
                     part for part in original_parts
@@ -610,8 +900,7 @@ Examples:
 
         if changes_made:
             # Save the cleaned data back to the JSON file
-            with MASTER_JSON_PATH.open("w", encoding=ENCODING) as file:
-                json.dump(data, file, ensure_ascii=False, indent=2)
+            save_master_json(data)
 
             console.print(table)
             console.print("[green]Extractos cleared successfully.[/green]")
@@ -625,7 +914,9 @@ Examples:
         add_duration=args.add_total_duration,
         clean_links=args.clean_promo_links,
         dry_run=args.dry_run,
-        verbose=args.verbose
+        verbose=args.verbose,
+        streaming=args.streaming,
+        compact=args.compact
     )
 
 # Update the `display_titles_table` function to include a column for the number of parts
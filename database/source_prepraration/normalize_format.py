@@ -16,6 +16,13 @@ from rich.logging import RichHandler
 
 import config
 
+# orjson is optional; stdlib json is used when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def normalize_web_parse(input_path: Path, output_path: Path) -> None:
     """
@@ -27,8 +34,11 @@ def normalize_web_parse(input_path: Path, output_path: Path) -> None:
     """
     logger = logging.getLogger(__name__)
     logger.info(f"Loading web parse data from {input_path}")
-    with input_path.open("r", encoding=config.ENCODING) as f:
-        data = json.load(f)
+    if ORJSON_AVAILABLE:
+        data = orjson.loads(input_path.read_bytes())
+    else:
+        with input_path.open("r", encoding=config.ENCODING) as f:
+            data = json.load(f)
     if isinstance(data, dict):
         entries = list(data.values())
         logger.debug(f"Converted {len(entries)} entries from dict to list")
@@ -36,8 +46,11 @@ def normalize_web_parse(input_path: Path, output_path: Path) -> None:
         logger.warning("Input JSON is not a dict; no conversion applied.")
         entries = data
     logger.info(f"Writing normalized data to {output_path}")
-    with output_path.open("w", encoding=config.ENCODING) as f:
-        json.dump(entries, f, ensure_ascii=False, indent=2)
+    if ORJSON_AVAILABLE:
+        output_path.write_bytes(orjson.dumps(entries, option=orjson.OPT_INDENT_2))
+    else:
+        with output_path.open("w", encoding=config.ENCODING) as f:
+            json.dump(entries, f, ensure_ascii=False, indent=2)
     logger.info("Normalization complete.")
 
 
@@ -19,14 +19,24 @@ import os
 import re
 import json
 import argparse
+import functools
 import logging
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Iterable, List, Tuple, Optional, Any
 
 from rich.console import Console
 from rich.table import Table
 from rich.progress import track
 
+# orjson is optional; stdlib json is used when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -45,11 +55,37 @@ except ImportError:
     sys.exit(1)
 
 # Define paths to JSON files
-DATA_DIR = Path(config.DATA_DIR)
+DATA_DIR = config.DATA_DIR
 AUDIOFEED_JSON = DATA_DIR / "parsed_json" / "audiofeed_index.json"
 CBINFO_JSON = DATA_DIR / "parsed_json" / "cbinfo_index.json"
 WEB_PARSE_JSON = DATA_DIR / "parsed_json" / "web_parse.json"
 
+# IDs already in the target "Ep###_A|B|Supl" format
+CANONICAL_EPISODE_ID_RE = re.compile(r"Ep\d{3}(?:_(?:A|B|Supl))?")
+# Loose episode ID: "Ep" prefix (any case, optional dot), number, optional suffix
+EPISODE_ID_RE = re.compile(r"[Ee][Pp]\.?(\d+)([_\-]?[A-Za-z]+)?")
+# Suffix substrings that mark a supplementary episode
+SUPPLEMENT_TOKENS = ('supl', 'bonus', 'esp')
+
+
+def track_if_tty(data: List[Dict], description: str) -> Iterable[Dict]:
+    """
+    Wrap data in a rich progress bar only when stdout is an interactive terminal.
+    
+    Any list gets a bar on a TTY, however short. When output is piped or redirected
+    the items are returned unwrapped, so no control codes end up in logs.
+    
+    Args:
+        data: Items to iterate over
+        description: Progress bar label
+        
+    Returns:
+        An iterable over data
+    """
+    if sys.stdout.isatty():
+        return track(data, description=description)
+    return data
+
 
 def load_json_data(file_path: Path) -> List[Dict]:
     """
@@ -70,10 +106,13 @@ def load_json_data(file_path: Path) -> List[Dict]:
             logger.error(f"File not found: {file_path}")
             return []
         
+        if ORJSON_AVAILABLE:
+            return orjson.loads(file_path.read_bytes())
+        
         with open(file_path, 'r', encoding='utf-8') as file:
             data = json.load(file)
             return data
-    except json.JSONDecodeError:
+    except json.JSONDecodeError:  # also catches orjson.JSONDecodeError (a subclass)
         logger.error(f"Invalid JSON format in {file_path}")
         return []
     except Exception as e:
@@ -81,20 +120,27 @@ def load_json_data(file_path: Path) -> List[Dict]:
         return []
 
 
-def save_json_data(file_path: Path, data: List[Dict]) -> bool:
+def save_json_data(file_path: Path, data: List[Dict], compact: bool = False) -> bool:
     """
     Save data to a JSON file.
     
     Args:
         file_path: Path to the JSON file
         data: List of dictionaries to save
+        compact: Write without indentation or whitespace
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        with open(file_path, 'w', encoding='utf-8') as file:
-            json.dump(data, file, ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            file_path.write_bytes(orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as file:
+                if compact:
+                    json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
+                else:
+                    json.dump(data, file, ensure_ascii=False, indent=2)
         logger.info(f"Successfully saved data to {file_path}")
         return True
     except Exception as e:
@@ -102,21 +148,29 @@ def save_json_data(file_path: Path, data: List[Dict]) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_episode_id(episode_id: str) -> str:
     """
     Normalize an episode ID to the format "Ep###_A|B|Supl".
     
+    Results are memoized, since the same raw IDs recur across the
+    audiofeed, cbinfo and web sources.
+    
     Args:
         episode_id: The original episode ID
         
     Returns:
         The normalized episode ID
     """
+    # Fast path: already-normalized IDs are returned unchanged
+    if CANONICAL_EPISODE_ID_RE.fullmatch(episode_id):
+        return episode_id
+    
     # Remove spaces
     episode_id = episode_id.replace(" ", "")
     
     # Extract the episode number
-    match = re.search(r'[Ee][Pp]\.?(\d+)([_\-]?[A-Za-z]+)?', episode_id)
+    match = EPISODE_ID_RE.search(episode_id)
     if match:
         episode_num = match.group(1)
         suffix = match.group(2) if match.group(2) else ""
@@ -128,11 +182,14 @@ def normalize_episode_id(episode_id: str) -> str:
                 suffix = suffix[1:]  # Remove separator
             
             # If suffix is A or B, keep it as _A or _B
-            if suffix.upper() in ['A', 'B']:
-                suffix = f"_{suffix.upper()}"
+            suffix_upper = suffix.upper()
+            if suffix_upper in ('A', 'B'):
+                suffix = f"_{suffix_upper}"
             # If suffix indicates a supplement, normalize to _Supl
-            elif any(s in suffix.lower() for s in ['supl', 'bonus', 'esp']):
-                suffix = "_Supl"
+            else:
+                suffix_lower = suffix.lower()
+                if any(token in suffix_lower for token in SUPPLEMENT_TOKENS):
+                    suffix = "_Supl"
         
         # Always use 'Ep' prefix and zero-pad the number to 3 digits
         normalized_id = f"Ep{int(episode_num):03d}{suffix}"
@@ -142,6 +199,25 @@ def normalize_episode_id(episode_id: str) -> str:
     return episode_id
 
 
+def load_sources(sources: List[Tuple[str, Path]]) -> List[List[Dict]]:
+    """
+    Load several source files concurrently.
+    
+    The files are independent, so reading and parsing them in a thread pool
+    makes the "all" modes cost roughly the slowest load rather than the sum.
+    
+    Args:
+        sources: (source name, path) pairs
+        
+    Returns:
+        Loaded data for each source, in the same order
+    """
+    if len(sources) == 1:
+        return [load_json_data(sources[0][1])]
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        return list(executor.map(load_json_data, [path for _, path in sources]))
+
+
 def get_episode_id_field(source_type: str) -> str:
     """
     Get the field name for episode ID based on the source type.
@@ -186,8 +262,7 @@ def display_episode_ids(source_type: str) -> None:
         elif source_type == 'web':
             sources = [('web', WEB_PARSE_JSON)]
     
-    for src_name, src_path in sources:
-        data = load_json_data(src_path)
+    for (src_name, src_path), data in zip(sources, load_sources(sources)):
         if not data:
             console.print(f"[yellow]No data available for {src_name}[/yellow]")
             continue
@@ -211,12 +286,13 @@ def display_episode_ids(source_type: str) -> None:
         console.print(f"[blue]Total episodes in {src_name}: {len(data)}[/blue]\n")
 
 
-def normalize_episode_ids(source_type: str) -> None:
+def normalize_episode_ids(source_type: str, compact: bool = False) -> None:
     """
     Normalize episode IDs in the specified source.
     
     Args:
         source_type: Type of source data (audiofeed, cbinfo, web, or all)
+        compact: Write the updated JSON without indentation
     """
     if source_type not in ['audiofeed', 'cbinfo', 'web', 'all']:
         console.print(f"[red]Invalid source type: {source_type}[/red]")
@@ -235,8 +311,7 @@ def normalize_episode_ids(source_type: str) -> None:
         elif source_type == 'web':
             sources = [('web', WEB_PARSE_JSON)]
     
-    for src_name, src_path in sources:
-        data = load_json_data(src_path)
+    for (src_name, src_path), data in zip(sources, load_sources(sources)):
         if not data:
             console.print(f"[yellow]No data available for {src_name}[/yellow]")
             continue
@@ -248,9 +323,7 @@ def normalize_episode_ids(source_type: str) -> None:
         backup_path = src_path.with_suffix('.json.bak')
         try:
             if not backup_path.exists():
-                with open(src_path, 'r', encoding='utf-8') as src_file:
-                    with open(backup_path, 'w', encoding='utf-8') as bak_file:
-                        bak_file.write(src_file.read())
+                shutil.copyfile(src_path, backup_path)
                 logger.info(f"Created backup at {backup_path}")
         except Exception as e:
             logger.error(f"Failed to create backup: {str(e)}")
@@ -258,7 +331,7 @@ def normalize_episode_ids(source_type: str) -> None:
             continue
         
         # Normalize episode IDs
-        for item in track(data, description=f"Normalizing {src_name} IDs"):
+        for item in track_if_tty(data, f"Normalizing {src_name} IDs"):
             if field_name in item and item[field_name]:
                 original_id = item[field_name]
                 normalized_id = normalize_episode_id(original_id)
@@ -269,7 +342,7 @@ def normalize_episode_ids(source_type: str) -> None:
         
         # Save the changes
         if changes_made > 0:
-            if save_json_data(src_path, data):
+            if save_json_data(src_path, data, compact=compact):
                 console.print(f"[green]Successfully normalized {changes_made} episode IDs in {src_name}[/green]")
             else:
                 console.print(f"[red]Failed to save changes to {src_name}[/red]")
@@ -289,6 +362,8 @@ def main():
     group.add_argument("--normalize", choices=["audiofeed", "cbinfo", "web", "all"], 
                        help="Normalize episode IDs in the specified JSON database")
     
+    parser.add_argument("--compact", action="store_true",
+                        help="Write normalized JSON without indentation")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
     
     args = parser.parse_args()
@@ -301,7 +376,7 @@ def main():
     if args.display:
         display_episode_ids(args.display)
     elif args.normalize:
-        normalize_episode_ids(args.normalize)
+        normalize_episode_ids(args.normalize, compact=args.compact)
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ Process:
 4. Save cleaned web_parse.json.
 """
 import argparse
+import functools
 import json
 import logging
 import sys
@@ -25,6 +26,13 @@ from rich.prompt import Confirm
 sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
 import config
 
+# orjson is optional; stdlib json is used when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def setup_logging(verbose: bool) -> None:
     level = logging.DEBUG if verbose else logging.INFO
@@ -36,17 +44,31 @@ def setup_logging(verbose: bool) -> None:
     )
 
 
+@functools.lru_cache(maxsize=None)
+def get_netloc(link: str) -> str:
+    """Lower-cased network location of a link, parsed once per unique link."""
+    return urlparse(link).netloc.lower()
+
+
 def load_json(path: Path):
     if not path.exists():
         logging.critical(f"File not found: {path}")
         sys.exit(1)
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text(encoding=config.ENCODING))
 
 
-def save_json(path: Path, data):
+def save_json(path: Path, data, compact: bool = False):
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open('w', encoding=config.ENCODING) as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2))
+    else:
+        with path.open('w', encoding=config.ENCODING) as f:
+            if compact:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            else:
+                json.dump(data, f, ensure_ascii=False, indent=2)
     logging.info(f"Saved cleaned JSON to {path}")
 
 
@@ -57,48 +79,54 @@ def main():
     parser.add_argument('-v', '--verbose', action='store_true', help='Enable debug logging')
     parser.add_argument('-c', '--check-domain', type=str, metavar='DOMAIN',
                         help='Fuzzy-search for a specific domain and remove its links')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write cleaned JSON without indentation')
     args = parser.parse_args()
 
     setup_logging(args.verbose)
     console = Console()
 
-    web_parse_path = Path(config.DATA_DIR) / 'parsed_json' / 'web_parse.json'
+    web_parse_path = config.DATA_DIR / 'parsed_json' / 'web_parse.json'
     exclusion_path = Path(__file__).parent / 'links_domain_exclusion_list.json'
 
     data = load_json(web_parse_path)
     exclusions = load_json(exclusion_path) if exclusion_path.exists() else []
 
+    # bucket every link by domain in one pass; both steps below read from it
+    by_domain = defaultdict(lambda: {'links': set(), 'eps': set()})
+    if args.check_domain or exclusions:
+        for ep, meta in data.items():
+            for link in meta.get('ep_links', []):
+                bucket = by_domain[get_netloc(link)]
+                bucket['links'].add(link)
+                bucket['eps'].add(ep)
+
+    # links approved for removal; ep_links is filtered once after all prompts
+    remove_links = set()
+
     # optional check for specific domain pattern
     if args.check_domain:
         pattern = args.check_domain.lower()
-        matching_links = set()
-        for ep, meta in data.items():
-            for link in meta.get('ep_links', []):
-                dom = urlparse(link).netloc.lower()
-                if pattern in dom:
-                    matching_links.add(link)
+        matching_domains = [dom for dom in by_domain if pattern in dom]
+        matching_links = set().union(*(by_domain[dom]['links'] for dom in matching_domains))
         if matching_links:
             console.print(f"Found {len(matching_links)} links matching domain pattern '{pattern}':")
             for l in sorted(matching_links):
                 console.print(f"  - {l}")
             if Confirm.ask(f"Remove all links matching domain pattern '{pattern}'?", default=False):
                 logging.info(f"Removing links for pattern '{pattern}'")
-                for ep, meta in data.items():
-                    meta['ep_links'] = [l for l in meta.get('ep_links', []) if pattern not in urlparse(l).netloc.lower()]
+                remove_links |= matching_links
+                # removed links no longer count towards the exclusion stats
+                for dom in matching_domains:
+                    del by_domain[dom]
         else:
             console.print(f"No links matching domain pattern '{pattern}' found.")
 
     # step 3: domain exclusions
     if exclusions:
-        # aggregate domain stats
-        domain_stats = {dom: {'links': set(), 'eps': set()} for dom in exclusions}
-        for ep, meta in data.items():
-            for link in meta.get('ep_links', []):
-                dom = urlparse(link).netloc.lower()
-                if dom in domain_stats:
-                    domain_stats[dom]['links'].add(link)
-                    domain_stats[dom]['eps'].add(ep)
-        for dom, stats in domain_stats.items():
+        no_links = {'links': set(), 'eps': set()}
+        for dom in dict.fromkeys(exclusions):
+            stats = by_domain.get(dom, no_links)
             total_links = len(stats['links'])
             total_eps = len(stats['eps'])
             console.print(f"Domain [bold]{dom}[/]: {total_links} unique links in {total_eps} episodes")
@@ -107,12 +135,14 @@ def main():
                 console.print(f"  - {l}")
             if Confirm.ask(f"Remove all links from domain {dom}?", default=True):
                 logging.info(f"Removing domain links for {dom}")
-                # remove any link with this domain
-                for ep, meta in data.items():
-                    meta['ep_links'] = [l for l in meta.get('ep_links', []) if urlparse(l).netloc.lower() != dom]
+                remove_links |= stats['links']
+
+    if remove_links:
+        for ep, meta in data.items():
+            meta['ep_links'] = [l for l in meta.get('ep_links', []) if l not in remove_links]
 
     # save cleaned JSON
-    save_json(web_parse_path, data)
+    save_json(web_parse_path, data, compact=args.compact)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
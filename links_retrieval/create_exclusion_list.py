@@ -4,7 +4,7 @@ links_retrieval/create_exclusion_list.py
 Interactively build a JSON list of domains to exclude from link retrieval.
 
 Loads the parsed episodes JSON index, aggregates all unique HTTP(s) links by domain,
-and prompts the user to include domains in an exclusion list for future filtering.
+and lets the user pick, in a single prompt, which domains to add to an exclusion list for future filtering.
 
 Usage:
     python links_retrieval/create_exclusion_list.py [--verbose]
@@ -15,19 +15,40 @@ Outputs:
 import argparse
 import json
 import logging
+import os
+import re
 import sys
 from pathlib import Path
+from typing import Iterable, Iterator
 from urllib.parse import urlparse
 
 from rich.console import Console
 from rich.table import Table
-from rich.prompt import Confirm
+from rich.prompt import Prompt
 from rich.logging import RichHandler
 
 # ensure project root on path
 sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
 import config
 
+# orjson is optional; stdlib json is used when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson is optional; without it the whole parsed index is loaded to read its links
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# scheme://netloc prefix of an ordinary absolute URL; links it does not match (leading
+# whitespace, IPv6 brackets, no "//") are left to urlparse
+URL_NETLOC_RE = re.compile(r'[A-Za-z][A-Za-z0-9+.\-]*://([^/?#\[\]\s]*)(?=[/?#]|$)')
+
 
 def setup_logging(verbose: bool) -> None:
     level = logging.DEBUG if verbose else logging.INFO
@@ -44,14 +65,47 @@ def load_parsed_json(path: Path) -> dict:
     if not path.exists():
         logging.critical(f"Parsed JSON not found: {path}")
         sys.exit(1)
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
     with path.open(encoding=config.ENCODING) as f:
         return json.load(f)
 
 
+def iter_parsed_links(path: Path) -> Iterator[str]:
+    """
+    Yield every episode link in the parsed episodes JSON index.
+
+    Accepts both the list of episodes written by normalize_format.py and the older
+    dict keyed by episode ID. With ijson installed the file is streamed: for the list
+    format only the ep_links arrays are materialized, while for the legacy dict format
+    each episode dict is still built in full (one at a time) before its links are read.
+    """
+    if not IJSON_AVAILABLE:
+        parsed = load_parsed_json(path)
+        episodes = parsed.values() if isinstance(parsed, dict) else parsed
+        for meta in episodes:
+            yield from meta.get('ep_links', [])
+        return
+
+    if not path.exists():
+        logging.critical(f"Parsed JSON not found: {path}")
+        sys.exit(1)
+    with path.open('rb') as f:
+        is_dict = f.read(64).lstrip()[:1] == b'{'
+        f.seek(0)
+        if is_dict:
+            for epid, meta in ijson.kvitems(f, ''):
+                yield from meta.get('ep_links', [])
+        else:
+            yield from ijson.items(f, 'item.ep_links.item')
+
+
 def load_existing_exclusions(path: Path) -> list[str]:
     """Load existing exclusion list or return empty if none."""
     if path.exists():
         try:
+            if ORJSON_AVAILABLE:
+                return orjson.loads(path.read_bytes())
             return json.loads(path.read_text(encoding=config.ENCODING))
         except Exception as e:
             logging.error(f"Error reading existing exclusion list: {e}")
@@ -61,24 +115,59 @@ def load_existing_exclusions(path: Path) -> list[str]:
 def save_exclusions(path: Path, domains: list[str]) -> None:
     """Save the exclusion domains list to JSON."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open('w', encoding=config.ENCODING) as f:
-        json.dump(domains, f, ensure_ascii=False, indent=2)
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(domains, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(domains, ensure_ascii=False, indent=2).encode(config.ENCODING)
+    # Write a sibling temp file and swap it in, so the list is never left half-written
+    tmp_path = path.with_suffix('.json.tmp')
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
     logging.info(f"Saved {len(domains)} excluded domains to {path}")
 
 
-def aggregate_domains(parsed: dict) -> dict[str, set[str]]:
+def get_domain(link: str) -> str:
+    """Lower-cased network location of a link, as urlparse(link).netloc.lower()."""
+    match = URL_NETLOC_RE.match(link)
+    if match:
+        return match.group(1).lower()
+    return urlparse(link).netloc.lower()
+
+
+def aggregate_domains(links: Iterable[str]) -> dict[str, set[str]]:
     """Aggregate unique links by domain."""
     domain_links: dict[str, set[str]] = {}
-    for epid, meta in parsed.items():
-        for link in meta.get('ep_links', []):
-            try:
-                domain = urlparse(link).netloc.lower()
-            except Exception:
-                continue
-            domain_links.setdefault(domain, set()).add(link)
+    for link in links:
+        try:
+            domain = get_domain(link)
+        except Exception:
+            continue
+        domain_links.setdefault(domain, set()).add(link)
     return domain_links
 
 
+def parse_selection(answer: str, count: int) -> list[int]:
+    """
+    Parse a selection like "1,3,5-8" into zero-based indices (blank selects nothing).
+
+    Raises:
+        ValueError: If a number or range is malformed or outside 1..count
+    """
+    selected: list[int] = []
+    for token in answer.replace(' ', '').split(','):
+        if not token:
+            continue
+        start, sep, end = token.partition('-')
+        try:
+            first, last = int(start), int(end) if sep else int(start)
+        except ValueError:
+            raise ValueError(f"Invalid selection: '{token}'") from None
+        if not 1 <= first <= last <= count:
+            raise ValueError(f"Selection out of range 1-{count}: '{token}'")
+        selected.extend(range(first - 1, last))
+    return list(dict.fromkeys(selected))
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Interactively create domain exclusion list from web-parse JSON."
@@ -92,13 +181,12 @@ def main() -> None:
     console = Console()
 
     # Paths
-    parsed_path = Path(config.DATA_DIR) / 'parsed_json' / 'web_parse.json'
+    parsed_path = config.DATA_DIR / 'parsed_json' / 'web_parse.json'
     exclude_path = Path(__file__).parent / 'links_domain_exclusion_list.json'
 
     # Load data
-    parsed = load_parsed_json(parsed_path)
     existing = load_existing_exclusions(exclude_path)
-    domain_links = aggregate_domains(parsed)
+    domain_links = aggregate_domains(iter_parsed_links(parsed_path))
 
     # Build sorted list by count descending
     domains_sorted = sorted(
@@ -108,24 +196,39 @@ def main() -> None:
     console.print(f"Found [bold]{len(domains_sorted)}[/bold] domains in parsed JSON.")
     new_exclusions = existing.copy()
 
+    # Domains not yet excluded are numbered for selection
+    candidates = [domain for domain, _ in domains_sorted if domain not in existing]
+    candidate_numbers = {domain: i for i, domain in enumerate(candidates, start=1)}
+
     table = Table(title="Domain Link Counts")
+    table.add_column("#", style="green", justify="right")
     table.add_column("Domain", style="cyan")
     table.add_column("# Links", style="magenta")
     table.add_column("Excluded?", style="red")
 
     for domain, links in domains_sorted:
-        excluded = domain in existing
-        table.add_row(domain, str(len(links)), 'yes' if excluded else 'no')
+        number = candidate_numbers.get(domain)
+        table.add_row(
+            str(number) if number else '', domain, str(len(links)),
+            'no' if number else 'yes'
+        )
     console.print(table)
 
-    # Interactive prompt
-    for domain, links in domains_sorted:
-        if domain in existing:
-            continue
-        prompt = f"Exclude domain '{domain}' with {len(links)} links?"
-        if Confirm.ask(prompt, default=False):
-            logging.info(f"Excluding domain: {domain}")
-            new_exclusions.append(domain)
+    # Interactive prompt: pick every domain to exclude in one answer
+    if candidates:
+        while True:
+            answer = Prompt.ask(
+                "Domains to exclude (numbers or ranges, e.g. 1,3,5-8; blank for none)",
+                default="", show_default=False
+            )
+            try:
+                selected = parse_selection(answer, len(candidates))
+                break
+            except ValueError as e:
+                console.print(f"[red]{e}[/red]")
+        for index in selected:
+            logging.info(f"Excluding domain: {candidates[index]}")
+            new_exclusions.append(candidates[index])
 
     # Deduplicate and sort
     final = sorted(set(new_exclusions))
@@ -9,17 +9,18 @@ Provides three main operations:
     --validate: Check for missing normalized names in filled contertulios via fuzzy matching.
 
 Usage:
-    python -m names_normalization.normalize_contertulios [--substitute-aliases | --assisted-completion | --validate] [--verbose] [--output PATH] [--config PATH]
+    python -m names_normalization.normalize_contertulios [--substitute-aliases | --assisted-completion | --validate] [--verbose] [--output PATH] [--config PATH] [--compact] [--streaming]
 
 See --help for details.
 """
 import argparse
+import functools
 import json
 import os
 import sys
 import importlib.util
 from pathlib import Path
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Set, Optional, Tuple, Callable, Iterable, Iterator, BinaryIO
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.prompt import Prompt
@@ -33,6 +34,20 @@ try:
 except ImportError:
     config = None
 
+# orjson is optional; stdlib json is used when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson is optional; it is only needed for --streaming
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # ========== Logging Setup ==========
 console = Console()
 logging.basicConfig(
@@ -46,6 +61,12 @@ logger = logging.getLogger("normalize_contertulios")
 # Default similarity threshold for fuzzy matching
 DEFAULT_SIMILARITY_THRESHOLD = 70.0
 
+# Patterns used to extract potential names from raw descriptions: single capitalized
+# words, and runs of them joined by whitespace other than newlines or tabs (so a run
+# never crosses the ,.;:() separators, newlines or tabs)
+NAME_WORD_RE = re.compile(r'\b[A-Z][a-zñáéíóúü]+\b')
+FULL_NAME_RE = re.compile(r'\b[A-Z][a-zñáéíóúü]+(?:[^\S\n\t]+[A-Z][a-zñáéíóúü]+)+\b')
+
 # ========== Helper Functions ==========
 def get_contertulios_path() -> Path:
     """Get the path to contertulios.json using config or fallback."""
@@ -62,21 +83,68 @@ def get_cbinfo_index_path() -> Path:
 def load_json(path: Path) -> Any:
     """Load a JSON file with UTF-8 encoding."""
     try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(Path(path).read_bytes())
         with open(path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except Exception as e:
         logger.error(f"Failed to load JSON from {path}: {e}")
         sys.exit(1)
 
-def save_json(data: Any, path: Path) -> None:
-    """Save a JSON file with UTF-8 encoding."""
+def save_json(data: Any, path: Path, compact: bool = False) -> None:
+    """Save a JSON file with UTF-8 encoding (indented unless compact)."""
+    # Serialize fully before touching the file, then swap a sibling temp file into place
+    # so an interrupted run never leaves a truncated index behind
+    path = Path(path)
+    tmp_path = path.with_suffix('.json.tmp')
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2)
+        elif compact:
+            payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        else:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
     except Exception as e:
         logger.error(f"Failed to save JSON to {path}: {e}")
         sys.exit(1)
 
+def stream_episodes(src: BinaryIO, dst: BinaryIO, compact: bool = False) -> Iterator[Dict]:
+    """
+    Yield cbinfo_index.json episodes one at a time, writing each back once updated.
+    
+    Episodes are parsed incrementally with ijson, so only one is held in memory. Each
+    episode is written to dst when the consumer asks for the next one, i.e. after it has
+    been updated in place. The output matches save_json's layout for the same compact setting.
+    
+    Args:
+        src (BinaryIO): cbinfo_index.json opened in binary mode
+        dst (BinaryIO): Binary file for the updated JSON
+        compact (bool): Write without indentation or whitespace
+        
+    Yields:
+        Dict: Episode dictionaries
+    """
+    dst.write(b"[")
+    written = False
+    for episode in ijson.items(src, "item", use_float=True):
+        yield episode
+        if compact:
+            if ORJSON_AVAILABLE:
+                encoded = orjson.dumps(episode)
+            else:
+                encoded = json.dumps(episode, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            dst.write(b"," + encoded if written else encoded)
+        else:
+            if ORJSON_AVAILABLE:
+                encoded = orjson.dumps(episode, option=orjson.OPT_INDENT_2)
+            else:
+                encoded = json.dumps(episode, ensure_ascii=False, indent=2).encode('utf-8')
+            dst.write((b",\n  " if written else b"\n  ") + encoded.replace(b"\n", b"\n  "))
+        written = True
+    dst.write(b"\n]" if written and not compact else b"]")
+
 def load_normalized_names() -> Dict[str, List[str]]:
     """
     Load normalized names and their aliases from contertulios.json.
@@ -120,29 +188,55 @@ def extract_names_from_description(raw_description: str) -> Set[str]:
     Returns:
         Set[str]: Set of potential name mentions
     """
-    # Split text by common separators and get words that could be names
-    # (capitalized words not at the beginning of sentences)
-    words = re.split(r'[,.;:\n\t\(\)]', raw_description)
-    potential_names = set()
-    
-    for word_group in words:
-        # Look for capitalized words that aren't at the beginning of sentences
-        word_group = word_group.strip()
-        if not word_group:
-            continue
-            
-        # Extract potential names (words starting with uppercase)
-        matches = re.findall(r'\b[A-Z][a-zñáéíóúü]+\b', word_group)
-        potential_names.update(matches)
-        
-        # Also look for full names (sequences of capitalized words)
-        full_names = re.findall(r'\b[A-Z][a-zñáéíóúü]+(?:\s+[A-Z][a-zñáéíóúü]+)+\b', word_group)
-        potential_names.update(full_names)
+    # Scan the whole text once per pattern; the separators are non-word characters, so
+    # word boundaries fall exactly where splitting on them would have put them
+    potential_names = set(NAME_WORD_RE.findall(raw_description))
+    potential_names.update(FULL_NAME_RE.findall(raw_description))
     
     return potential_names
 
+def build_match_choices(normalized_names: Dict[str, List[str]]) -> Tuple[List[str], List[str]]:
+    """
+    Flatten normalized names and their aliases into parallel lists for batched fuzzy matching.
+    
+    Args:
+        normalized_names (Dict[str, List[str]]): Dictionary of normalized names and their aliases
+        
+    Returns:
+        Tuple[List[str], List[str]]: Lowercased candidate strings, and the normalized name each
+        one belongs to (each normalized name followed by its aliases, in dictionary order)
+    """
+    choices = []
+    choice_norms = []
+    for norm, aliases in normalized_names.items():
+        choices.append(norm.lower())
+        choice_norms.append(norm)
+        for alias in aliases:
+            choices.append(alias.lower())
+            choice_norms.append(norm)
+    return choices, choice_norms
+
+def build_exact_lookup(normalized_names: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Map each normalized name and alias, case-sensitively, to its normalized name.
+    
+    Args:
+        normalized_names (Dict[str, List[str]]): Dictionary of normalized names and their aliases
+        
+    Returns:
+        Dict[str, str]: Exact name -> normalized name. A normalized name maps to itself, and an
+        alias listed under several names keeps the first one in dictionary order
+    """
+    exact_lookup = {norm: norm for norm in normalized_names}
+    for norm, aliases in normalized_names.items():
+        for alias in aliases:
+            exact_lookup.setdefault(alias, norm)
+    return exact_lookup
+
 def find_best_normalized_match(name: str, normalized_names: Dict[str, List[str]], 
-                                threshold: float = DEFAULT_SIMILARITY_THRESHOLD) -> str:
+                                threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                                choices: Optional[Tuple[List[str], List[str]]] = None,
+                                exact_lookup: Optional[Dict[str, str]] = None) -> str:
     """
     Find the best normalized name match for a given name using fuzzy matching.
     
@@ -150,55 +244,66 @@ def find_best_normalized_match(name: str, normalized_names: Dict[str, List[str]]
         name (str): The name to find a match for
         normalized_names (Dict[str, List[str]]): Dictionary of normalized names and their aliases
         threshold (float): Minimum similarity score to consider a match (0-100)
+        choices (Optional[Tuple[List[str], List[str]]]): Output of build_match_choices; pass it
+            when matching many names against the same vocabulary to build it only once
+        exact_lookup (Optional[Dict[str, str]]): Output of build_exact_lookup, likewise
         
     Returns:
         str: The best matching normalized name, or empty string if no match above threshold
     """
-    best_score = 0
-    best_match = ""
+    # First try exact matches with normalized names, then with aliases
+    if exact_lookup is None:
+        exact_lookup = build_exact_lookup(normalized_names)
+    exact_match = exact_lookup.get(name)
+    if exact_match is not None:
+        return exact_match
     
-    # First try exact matches with normalized names
-    if name in normalized_names:
-        return name
+    # If no exact match, score the name against every normalized name and alias in a single
+    # rapidfuzz call; extractOne keeps the first of equally scored candidates
+    if choices is None:
+        choices = build_match_choices(normalized_names)
+    choice_strings, choice_norms = choices
+    match = process.extractOne(name.lower(), choice_strings, scorer=fuzz.ratio, score_cutoff=threshold)
+    if match is None or match[1] <= 0:
+        return ""
+    return choice_norms[match[2]]
+
+def build_name_matcher(normalized_names: Dict[str, List[str]],
+                       threshold: float = DEFAULT_SIMILARITY_THRESHOLD) -> Callable[[str], str]:
+    """
+    Build a memoized find_best_normalized_match bound to one vocabulary and threshold.
     
-    # Then check if name is in any alias list
-    for norm, aliases in normalized_names.items():
-        if name in aliases:
-            return norm
+    The same extracted tokens (common first names) recur across many descriptions, so each
+    distinct name is only matched once per run. The cache belongs to the returned function,
+    so a fresh matcher never sees results computed against a different vocabulary.
     
-    # If no exact match, try fuzzy matching with normalized names and aliases
-    for norm, aliases in normalized_names.items():
-        # Check similarity with the normalized name
-        score = fuzz.ratio(name.lower(), norm.lower())
-        if score > best_score and score >= threshold:
-            best_score = score
-            best_match = norm
+    Args:
+        normalized_names (Dict[str, List[str]]): Dictionary of normalized names and their aliases
+        threshold (float): Minimum similarity score to consider a match (0-100)
         
-        # Check similarity with each alias
-        for alias in aliases:
-            score = fuzz.ratio(name.lower(), alias.lower())
-            if score > best_score and score >= threshold:
-                best_score = score
-                best_match = norm
+    Returns:
+        Callable[[str], str]: Function mapping an extracted name to its best normalized match
+    """
+    choices = build_match_choices(normalized_names)
+    exact_lookup = build_exact_lookup(normalized_names)
+    
+    @functools.lru_cache(maxsize=8192)
+    def match_name(name: str) -> str:
+        return find_best_normalized_match(name, normalized_names, threshold, choices, exact_lookup)
     
-    return best_match
+    return match_name
 
-# ========== Main Operations ==========
-def substitute_aliases(episodes: List[Dict], normalized_names: Dict[str, List[str]]) -> List[Dict]:
+def build_alias_lookup(normalized_names: Dict[str, List[str]]) -> Dict[str, str]:
     """
-    Replace aliases in episode contertulios lists with their canonical normalized names.
+    Build a flat lookup from lowercased aliases and normalized names to the normalized name.
     
     Args:
-        episodes (List[Dict]): List of episode dictionaries from cbinfo_index.json
         normalized_names (Dict[str, List[str]]): Dictionary of normalized names and their aliases
         
     Returns:
-        List[Dict]: Updated episodes with normalized contertulios names
+        Dict[str, str]: Lowercased alias or normalized name -> normalized name (a normalized
+        name always maps to itself, even if it also appears as another name's alias)
     """
-    normalized_episodes = []
-    changes_count = 0
-    
-    # Create a flat lookup dictionary for faster alias resolution
     alias_to_normalized = {}
     for norm, aliases in normalized_names.items():
         for alias in aliases:
@@ -207,31 +312,81 @@ def substitute_aliases(episodes: List[Dict], normalized_names: Dict[str, List[st
     # Add normalized names themselves to the lookup
     for norm in normalized_names:
         alias_to_normalized[norm.lower()] = norm
+    return alias_to_normalized
+
+# ========== Main Operations ==========
+def iter_substitute_aliases(episodes: Iterable[Dict], normalized_names: Dict[str, List[str]],
+                            alias_to_normalized: Optional[Dict[str, str]] = None,
+                            counts: Optional[Dict[str, int]] = None) -> Iterator[Dict]:
+    """
+    Replace aliases in episode contertulios lists with their canonical normalized names,
+    yielding each episode once it has been updated in place.
+    
+    Args:
+        episodes (Iterable[Dict]): Episode dictionaries from cbinfo_index.json
+        normalized_names (Dict[str, List[str]]): Dictionary of normalized names and their aliases
+        alias_to_normalized (Optional[Dict[str, str]]): Output of build_alias_lookup; built from
+            normalized_names when not given
+        counts (Optional[Dict[str, int]]): If given, its "episodes" and "changes" entries are
+            incremented as episodes are processed
+        
+    Yields:
+        Dict: Each episode, with normalized contertulios names
+    """
+    if counts is None:
+        counts = {}
+    counts.setdefault("episodes", 0)
+    counts.setdefault("changes", 0)
+    
+    if alias_to_normalized is None:
+        alias_to_normalized = build_alias_lookup(normalized_names)
+    # Normalized names the lookup maps to themselves; after a first pass most contertulios
+    # are already one of these, so they skip the lower() and the lookup
+    canonical_names = frozenset(
+        norm for norm in normalized_names if alias_to_normalized.get(norm.lower()) == norm
+    )
+    get_normalized = alias_to_normalized.get
     
     for episode in episodes:
+        counts["episodes"] += 1
         # Skip if no contertulios
         if 'contertulios' not in episode or not episode['contertulios']:
-            normalized_episodes.append(episode)
+            yield episode
             continue
         
         # Check each contertulio name for possible normalization
-        normalized_contertulios = []
-        for name in episode['contertulios']:
-            lower_name = name.lower()
-            if lower_name in alias_to_normalized:
-                normalized_name = alias_to_normalized[lower_name]
+        contertulios = episode['contertulios']
+        normalized_contertulios = [
+            name if name in canonical_names else get_normalized(name.lower(), name)
+            for name in contertulios
+        ]
+        if normalized_contertulios != contertulios:
+            for name, normalized_name in zip(contertulios, normalized_contertulios):
                 if normalized_name != name:
                     logger.debug(f"Normalized '{name}' to '{normalized_name}' in episode {episode.get('episode_id', 'unknown')}")
-                    changes_count += 1
-                normalized_contertulios.append(normalized_name)
-            else:
-                normalized_contertulios.append(name)
-        
-        # Replace with normalized list
-        updated_episode = {**episode, 'contertulios': normalized_contertulios}
-        normalized_episodes.append(updated_episode)
+                    counts["changes"] += 1
+            # Replace with normalized list (in place; only this field changes)
+            episode['contertulios'] = normalized_contertulios
+        yield episode
+
+def substitute_aliases(episodes: List[Dict], normalized_names: Dict[str, List[str]],
+                       alias_to_normalized: Optional[Dict[str, str]] = None) -> List[Dict]:
+    """
+    Replace aliases in episode contertulios lists with their canonical normalized names.
     
-    logger.info(f"Normalized {changes_count} contertulios names across {len(episodes)} episodes")
+    Args:
+        episodes (List[Dict]): List of episode dictionaries from cbinfo_index.json
+        normalized_names (Dict[str, List[str]]): Dictionary of normalized names and their aliases
+        alias_to_normalized (Optional[Dict[str, str]]): Output of build_alias_lookup; built from
+            normalized_names when not given
+        
+    Returns:
+        List[Dict]: Updated episodes with normalized contertulios names (episode dicts are
+        modified in place)
+    """
+    counts = {"episodes": 0, "changes": 0}
+    normalized_episodes = list(iter_substitute_aliases(episodes, normalized_names, alias_to_normalized, counts))
+    logger.info(f"Normalized {counts['changes']} contertulios names across {counts['episodes']} episodes")
     return normalized_episodes
 
 def assisted_completion(episodes: List[Dict], normalized_names: Dict[str, List[str]], 
@@ -248,10 +403,12 @@ def assisted_completion(episodes: List[Dict], normalized_names: Dict[str, List[s
         non_interactive (bool): If True, run in batch mode without prompts
         
     Returns:
-        List[Dict]: Updated episodes with user-approved normalized contertulios
+        List[Dict]: Updated episodes with user-approved normalized contertulios (episode dicts
+        are modified in place)
     """
     updated_episodes = []
     completion_count = 0
+    match_name = build_name_matcher(normalized_names, threshold)
     for episode in episodes:
         # Skip if not an episode or already has contertulios
         if episode.get('entry_type') != 'episode':
@@ -280,7 +437,7 @@ def assisted_completion(episodes: List[Dict], normalized_names: Dict[str, List[s
         # Track which normalized names are suggested and which raw names map to them
         norm_to_raws = {}
         for name in potential_names:
-            best_match = find_best_normalized_match(name, normalized_names, threshold)
+            best_match = match_name(name)
             if best_match:
                 norm_to_raws.setdefault(best_match, []).append(name)
         # Remove normalized names already present (case-insensitive)
@@ -326,11 +483,9 @@ def assisted_completion(episodes: List[Dict], normalized_names: Dict[str, List[s
                     console.print("[yellow]Skipping remaining suggestions for this episode[/yellow]")
                     break
         if suggested_contertulios:
-            updated_episode = {**episode, 'contertulios': suggested_contertulios}
+            episode['contertulios'] = suggested_contertulios
             completion_count += 1
-        else:
-            updated_episode = episode
-        updated_episodes.append(updated_episode)
+        updated_episodes.append(episode)
     logger.info(f"Completed contertulios for {completion_count} episodes")
     return updated_episodes
 
@@ -349,9 +504,11 @@ def validate_contertulios(episodes: List[Dict], normalized_names: Dict[str, List
         
     Returns:
         List[Dict]: Updated episodes with additional user-approved normalized contertulios
+        (episode dicts are modified in place)
     """
     updated_episodes = []
     validated_count = 0
+    match_name = build_name_matcher(normalized_names, threshold)
     
     for episode in episodes:
         # Skip if not an episode or no contertulios
@@ -380,7 +537,7 @@ def validate_contertulios(episodes: List[Dict], normalized_names: Dict[str, List
         missing_potential = []
         norm_to_raws = {}
         for name in potential_names:
-            best_match = find_best_normalized_match(name, normalized_names, threshold)
+            best_match = match_name(name)
             if best_match and best_match.lower() not in current_contertulios:
                 norm_to_raws.setdefault(best_match, []).append(name)
         # Discard suggestions with only one raw match and that match is a non-spaced option
@@ -423,13 +580,10 @@ def validate_contertulios(episodes: List[Dict], normalized_names: Dict[str, List
                     break
         
         if additional_contertulios:
-            updated_contertulios = episode['contertulios'] + additional_contertulios
-            updated_episode = {**episode, 'contertulios': updated_contertulios}
+            episode['contertulios'].extend(additional_contertulios)
             validated_count += 1
-        else:
-            updated_episode = episode
         
-        updated_episodes.append(updated_episode)
+        updated_episodes.append(episode)
     
     logger.info(f"Added missing contertulios to {validated_count} episodes")
     return updated_episodes
@@ -439,6 +593,9 @@ def substitute_aliases_cli(args):
     """CLI entrypoint for --substitute-aliases operation"""
     cbinfo_path = get_cbinfo_index_path()
     normalized_names = load_normalized_names()
+    if args.streaming:
+        substitute_aliases_streaming(cbinfo_path, normalized_names, args)
+        return
     episodes = load_json(cbinfo_path)
     
     logger.info(f"Loaded {len(episodes)} episodes from {cbinfo_path}")
@@ -447,7 +604,31 @@ def substitute_aliases_cli(args):
     updated_episodes = substitute_aliases(episodes, normalized_names)
     
     output_path = args.output if args.output else cbinfo_path
-    save_json(updated_episodes, Path(output_path))
+    save_json(updated_episodes, Path(output_path), compact=args.compact)
+    logger.info(f"Saved updated episodes to {output_path}")
+
+def substitute_aliases_streaming(cbinfo_path: Path, normalized_names: Dict[str, List[str]], args) -> None:
+    """Run --substitute-aliases one episode at a time (--streaming), swapping the result into place."""
+    if not IJSON_AVAILABLE:
+        logger.error("--streaming requires the 'ijson' package. Install it using 'pip install ijson'.")
+        sys.exit(1)
+    logger.info(f"Streaming episodes from {cbinfo_path}")
+    logger.info(f"Loaded {len(normalized_names)} normalized names from {get_contertulios_path()}")
+    
+    output_path = Path(args.output) if args.output else cbinfo_path
+    tmp_path = output_path.with_suffix('.json.tmp')
+    counts = {"episodes": 0, "changes": 0}
+    try:
+        with open(cbinfo_path, 'rb') as src, open(tmp_path, 'wb', buffering=1 << 20) as dst:
+            for _ in iter_substitute_aliases(stream_episodes(src, dst, compact=args.compact),
+                                             normalized_names, counts=counts):
+                pass
+        os.replace(tmp_path, output_path)
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.error(f"Failed to stream JSON from {cbinfo_path} to {output_path}: {e}")
+        sys.exit(1)
+    logger.info(f"Normalized {counts['changes']} contertulios names across {counts['episodes']} episodes")
     logger.info(f"Saved updated episodes to {output_path}")
 
 def assisted_completion_cli(args):
@@ -462,7 +643,7 @@ def assisted_completion_cli(args):
     updated_episodes = assisted_completion(episodes, normalized_names, threshold=args.threshold, non_interactive=args.non_interactive)
     
     output_path = args.output if args.output else cbinfo_path
-    save_json(updated_episodes, Path(output_path))
+    save_json(updated_episodes, Path(output_path), compact=args.compact)
     logger.info(f"Saved updated episodes to {output_path}")
 
 def validate_contertulios_cli(args):
@@ -477,7 +658,7 @@ def validate_contertulios_cli(args):
     updated_episodes = validate_contertulios(episodes, normalized_names, threshold=args.threshold, non_interactive=args.non_interactive)
     
     output_path = args.output if args.output else cbinfo_path
-    save_json(updated_episodes, Path(output_path))
+    save_json(updated_episodes, Path(output_path), compact=args.compact)
     logger.info(f"Saved updated episodes to {output_path}")
 
 # ========== CLI Main ==========
@@ -499,9 +680,15 @@ def main():
     parser.add_argument('--config', '-c', type=str, help="Path to configuration file.")
     parser.add_argument('--non-interactive', action='store_true', help="Run in batch mode without prompts.")
     parser.add_argument('--log-file', type=str, help="Path to log output file.")
+    parser.add_argument('--compact', action='store_true',
+                      help="Write cbinfo_index.json without indentation.")
+    parser.add_argument('--streaming', action='store_true',
+                      help="With --substitute-aliases, process one episode at a time with ijson (optional dependency).")
     parser.add_argument('--threshold', '-t', type=float, default=DEFAULT_SIMILARITY_THRESHOLD,
                       help=f"Similarity threshold (0-100) for fuzzy matching (default: {DEFAULT_SIMILARITY_THRESHOLD}).")
     args = parser.parse_args()
+    if args.streaming and not args.substitute_aliases:
+        parser.error("--streaming is only supported with --substitute-aliases")
 
     # Setup logging verbosity
     if args.verbose:
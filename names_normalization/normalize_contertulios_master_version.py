@@ -28,12 +28,13 @@ See --help for details.
 Author: Miguel Di Lalla (2025)
 """
 import argparse
+import functools
 import json
 import os
 import sys
 import importlib.util
 from pathlib import Path
-from typing import Dict, List, Any, Set, Tuple
+from typing import Dict, List, Any, Set, Tuple, Optional, Callable
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.prompt import Prompt
@@ -51,6 +52,13 @@ try:
 except ImportError:
     config = None
 
+# orjson is optional; stdlib json is used when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # ========== Logging Setup ==========
 console = Console()
 logging.basicConfig(
@@ -64,6 +72,12 @@ logger = logging.getLogger("normalize_contertulios_master")
 # Default similarity threshold for fuzzy matching
 DEFAULT_SIMILARITY_THRESHOLD = 70.0
 
+# Patterns used to extract potential names from raw descriptions: single capitalized
+# words, and runs of them joined by whitespace other than newlines or tabs (so a run
+# never crosses the ,.;:() separators, newlines or tabs)
+NAME_WORD_RE = re.compile(r'\b[A-Z][a-zñáéíóúü]+\b')
+FULL_NAME_RE = re.compile(r'\b[A-Z][a-zñáéíóúü]+(?:[^\S\n\t]+[A-Z][a-zñáéíóúü]+)+\b')
+
 # ========== Helper Functions ==========
 def get_contertulios_path() -> Path:
     """Get the path to contertulios.json using config or fallback."""    
@@ -101,6 +115,8 @@ def create_backup(file_path: Path) -> Path:
 def load_json(path: Path) -> Any:
     """Load a JSON file with UTF-8 encoding."""    
     try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(Path(path).read_bytes())
         with open(path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except Exception as e:
@@ -109,9 +125,17 @@ def load_json(path: Path) -> Any:
 
 def save_json(data: Any, path: Path) -> None:
     """Save a JSON file with UTF-8 encoding."""    
+    # Serialize fully before touching the file, then swap a sibling temp file into place
+    # so an interrupted run never leaves a truncated index behind
+    path = Path(path)
+    tmp_path = path.with_suffix('.json.tmp')
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
     except Exception as e:
         logger.error(f"Failed to save JSON to {path}: {e}")
         sys.exit(1)
@@ -164,28 +188,55 @@ def extract_names_from_description(raw_description: str) -> Set[str]:
     Returns:
         Set[str]: Set of potential name mentions
     """
-    # Split text by common separators and get words that could be names
-    words = re.split(r'[,.;:\n\t\(\)]', raw_description)
-    potential_names = set()
-    
-    for word_group in words:
-        # Look for capitalized words that aren't at the beginning of sentences
-        word_group = word_group.strip()
-        if not word_group:
-            continue
-            
-        # Extract potential names (words starting with uppercase)
-        matches = re.findall(r'\b[A-Z][a-zñáéíóúü]+\b', word_group)
-        potential_names.update(matches)
-        
-        # Also look for full names (sequences of capitalized words)
-        full_names = re.findall(r'\b[A-Z][a-zñáéíóúü]+(?:\s+[A-Z][a-zñáéíóúü]+)+\b', word_group)
-        potential_names.update(full_names)
+    # Scan the whole text once per pattern; the separators are non-word characters, so
+    # word boundaries fall exactly where splitting on them would have put them
+    potential_names = set(NAME_WORD_RE.findall(raw_description))
+    potential_names.update(FULL_NAME_RE.findall(raw_description))
     
     return potential_names
 
+def build_match_choices(normalized_names: Dict[str, List[str]]) -> Tuple[List[str], List[str]]:
+    """
+    Flatten normalized names and their aliases into parallel lists for batched fuzzy matching.
+    
+    Args:
+        normalized_names (Dict[str, List[str]]): Dictionary of normalized names and their aliases
+        
+    Returns:
+        Tuple[List[str], List[str]]: Lowercased candidate strings, and the normalized name each
+        one belongs to (each normalized name followed by its aliases, in dictionary order)
+    """
+    choices = []
+    choice_norms = []
+    for norm, aliases in normalized_names.items():
+        choices.append(norm.lower())
+        choice_norms.append(norm)
+        for alias in aliases:
+            choices.append(alias.lower())
+            choice_norms.append(norm)
+    return choices, choice_norms
+
+def build_exact_lookup(normalized_names: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Map each normalized name and alias, case-sensitively, to its normalized name.
+    
+    Args:
+        normalized_names (Dict[str, List[str]]): Dictionary of normalized names and their aliases
+        
+    Returns:
+        Dict[str, str]: Exact name -> normalized name. A normalized name maps to itself, and an
+        alias listed under several names keeps the first one in dictionary order
+    """
+    exact_lookup = {norm: norm for norm in normalized_names}
+    for norm, aliases in normalized_names.items():
+        for alias in aliases:
+            exact_lookup.setdefault(alias, norm)
+    return exact_lookup
+
 def find_best_normalized_match(name: str, normalized_names: Dict[str, List[str]], 
-                              threshold: float = DEFAULT_SIMILARITY_THRESHOLD) -> str:
+                              threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                              choices: Optional[Tuple[List[str], List[str]]] = None,
+                              exact_lookup: Optional[Dict[str, str]] = None) -> str:
     """
     Find the best normalized name match for a given name using fuzzy matching.
     
@@ -193,38 +244,54 @@ def find_best_normalized_match(name: str, normalized_names: Dict[str, List[str]]
         name (str): The name to find a match for
         normalized_names (Dict[str, List[str]]): Dictionary of normalized names and their aliases
         threshold (float): Minimum similarity score to consider a match (0-100)
+        choices (Optional[Tuple[List[str], List[str]]]): Output of build_match_choices; pass it
+            when matching many names against the same vocabulary to build it only once
+        exact_lookup (Optional[Dict[str, str]]): Output of build_exact_lookup, likewise
         
     Returns:
         str: The best matching normalized name, or empty string if no match above threshold
     """
-    best_score = 0
-    best_match = ""
-    
-    # First try exact matches with normalized names
-    if name in normalized_names:
-        return name
+    # First try exact matches with normalized names, then with aliases
+    if exact_lookup is None:
+        exact_lookup = build_exact_lookup(normalized_names)
+    exact_match = exact_lookup.get(name)
+    if exact_match is not None:
+        return exact_match
+    
+    # If no exact match, score the name against every normalized name and alias in a single
+    # rapidfuzz call; extractOne keeps the first of equally scored candidates
+    if choices is None:
+        choices = build_match_choices(normalized_names)
+    choice_strings, choice_norms = choices
+    match = process.extractOne(name.lower(), choice_strings, scorer=fuzz.ratio, score_cutoff=threshold)
+    if match is None or match[1] <= 0:
+        return ""
+    return choice_norms[match[2]]
+
+def build_name_matcher(normalized_names: Dict[str, List[str]],
+                       threshold: float = DEFAULT_SIMILARITY_THRESHOLD) -> Callable[[str], str]:
+    """
+    Build a memoized find_best_normalized_match bound to one vocabulary and threshold.
     
-    # Then check if name is in any alias list
-    for norm, aliases in normalized_names.items():
-        if name in aliases:
-            return norm
+    The same extracted tokens (common first names) recur across many descriptions, so each
+    distinct name is only matched once per run. The cache belongs to the returned function,
+    so a fresh matcher never sees results computed against a different vocabulary.
     
-    # If no exact match, try fuzzy matching with normalized names and aliases
-    for norm, aliases in normalized_names.items():
-        # Check similarity with the normalized name
-        score = fuzz.ratio(name.lower(), norm.lower())
-        if score > best_score and score >= threshold:
-            best_score = score
-            best_match = norm
+    Args:
+        normalized_names (Dict[str, List[str]]): Dictionary of normalized names and their aliases
+        threshold (float): Minimum similarity score to consider a match (0-100)
         
-        # Check similarity with each alias
-        for alias in aliases:
-            score = fuzz.ratio(name.lower(), alias.lower())
-            if score > best_score and score >= threshold:
-                best_score = score
-                best_match = norm
+    Returns:
+        Callable[[str], str]: Function mapping an extracted name to its best normalized match
+    """
+    choices = build_match_choices(normalized_names)
+    exact_lookup = build_exact_lookup(normalized_names)
+    
+    @functools.lru_cache(maxsize=8192)
+    def match_name(name: str) -> str:
+        return find_best_normalized_match(name, normalized_names, threshold, choices, exact_lookup)
     
-    return best_match
+    return match_name
 
 def get_episode_identifier(episode: Dict) -> str:
     """
@@ -376,6 +443,7 @@ def assisted_completion(episodes: List[Dict], normalized_names: Dict[str, List[s
     changes_stats = {}  # format: "episode_num|part_idx": num_added_contertulios
     skipped_single_word_count = 0
     processed_count = 0
+    match_name = build_name_matcher(normalized_names, threshold)
     
     # Process each part
     for episode_idx, part_idx, episode, part in sorted_parts:
@@ -395,7 +463,7 @@ def assisted_completion(episodes: List[Dict], normalized_names: Dict[str, List[s
         # Track which normalized names are suggested and which raw names map to them
         norm_to_raws = {}
         for name in potential_names:
-            best_match = find_best_normalized_match(name, normalized_names, threshold)
+            best_match = match_name(name)
             if best_match:
                 norm_to_raws.setdefault(best_match, []).append(name)
         
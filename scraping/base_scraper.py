@@ -101,7 +101,7 @@ def main():
     setup_logging(level)
 
     base_url = "https://xn--sealyruido-u9a.com/?cat=1"
-    out_dir = Path(args.output) if args.output else Path(config.DATA_DIR) / "raw_html" / "episodes"
+    out_dir = Path(args.output) if args.output else config.DATA_DIR / "raw_html" / "episodes"
     out_dir.mkdir(parents=True, exist_ok=True)
 
     scrape_category(base_url, out_dir, config.TIMEOUT, config.RETRY_COUNT)
@@ -91,8 +91,8 @@ def main() -> None:
     level = logging.DEBUG if args.verbose else logging.INFO
     setup_logging(level)
 
-    episodes_dir = Path(config.DATA_DIR) / "raw_html" / "episodes"
-    output_file = Path(args.output) if args.output else Path(config.DATA_DIR) / "parsed_json" / "web_parse.json"
+    episodes_dir = config.DATA_DIR / "raw_html" / "episodes"
+    output_file = Path(args.output) if args.output else config.DATA_DIR / "parsed_json" / "web_parse.json"
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
     parsed = {}